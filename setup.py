@@ -44,6 +44,7 @@ setup(
     
     # Package discovery
     packages=find_packages(),
+    py_modules=['validate_config'],
     include_package_data=True,
     
     # Dependencies
@@ -57,6 +58,7 @@ setup(
         'console_scripts': [
             'sql-backup=sql_backup:cli_main',
             'sqlbackup=sql_backup:cli_main',  # Alternative name for backward compatibility
+            'sqlbackup-validate=validate_config:main',
         ],
     },  # Make sure sql_backup.cli_main exists and is importable
     
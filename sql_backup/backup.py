@@ -1,15 +1,28 @@
 import os
 import sys
 import subprocess
+import calendar
 import datetime
+import functools
+import gzip
+import lzma
+import shutil
+import signal
 import tarfile
 import tempfile
 import time
 import threading
-from itertools import cycle
-from fnmatch import fnmatch
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import fnmatch
+import re
 
-from .config import get_config
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+from .config import get_backup_settings, get_mysql_settings, get_export_settings, build_backup_settings
 from .logger import get_logger
 
 # Get logger for this module
@@ -21,30 +34,73 @@ GREEN = "\033[0;32m"
 YELLOW = "\033[0;33m"
 BLUE = "\033[0;34m"
 RESET = "\033[0m"
-TIMESTAMP = datetime.datetime.now().strftime("%F")
+_NOW = datetime.datetime.now()
+TIMESTAMP = _NOW.strftime("%F")
 
-# --- Configuration Variables (lazy-loaded) ---
-_config = None
-def _get_config():
-    global _config
-    if _config is None:
-        _config = get_config()
-    return _config
+# "Today" is fixed for the whole run, matching the TIMESTAMP used in file names
+_TODAY = _NOW.date()
+_TODAY_WEEKDAY = _TODAY.strftime("%A").lower()
+_LAST_DAY_OF_MONTH = calendar.monthrange(_TODAY.year, _TODAY.month)[1]
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# File extension written for each supported archive format
+ARCHIVE_EXTENSIONS = {
+    "none": "sql",
+    "gz": "sql.gz",
+    "xz": "sql.xz",
+    "tar.xz": "tar.xz",
+    "zip": "zip",
+    "rar": "rar",
+    "zstd": "sql.zst",
+    "lz4": "sql.lz4",
+}
+
+# Chunk size used when streaming mysqldump output into the archive, and the
+# kernel pipe buffer size requested for the dump pipe (Linux only)
+_COPY_BUFSIZE = 1 << 20
+_PIPE_SIZE = 1 << 20
+# fcntl only exposes F_SETPIPE_SZ on Python 3.10+; 1031 is its Linux value
+_F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+
+# --- Summary table layout ---
+_TABLE_SEPARATOR = f"|{'-'*27}|{'-'*17}|{'-'*12}|{'-'*14}|{'-'*16}|\n"
+_TABLE_HEADER = (
+    f"| {'Database':25} | {'Status':15} | {'Time (s)':10} | {'Dump Size':12} | {'Archive Size':12} |\n"
+    + _TABLE_SEPARATOR
+)
+_ROW_FMT = "| {db:25} | {color}{status:15}" + RESET + " | {elapsed:10} | {dump:12} | {archive:12} |\n"
+_STATUS_COLOR = {"Success": GREEN, "Error": RED}
+
+# Serializes console output from the parallel backup workers
+_print_lock = threading.Lock()
+
+# tqdm bar of the backup run in progress, which worker output must not draw over
+_progress_bar = None
 
+# mysqldump processes currently streaming, so an interrupt can stop them all
+_active_dumps = set()
+_active_dumps_lock = threading.Lock()
+# Set on Ctrl-C so workers start no new dump or compression
+_stop_requested = threading.Event()
+
+class _BackupInterrupted(Exception):
+    """The backup run was interrupted before this database was finished."""
+
+# --- Configuration Variables (lazy-loaded) ---
 def get_backup_dir():
-    return _get_config().get("backup", "backup_dir")
+    return get_backup_settings().backup_dir
 
 def get_archive_format():
-    return _get_config().get("backup", "archive_format").lower()
+    return get_backup_settings().archive_format
 
 def get_ignored_db_patterns():
-    return [p.strip() for p in _get_config().get("mysql", "ignored_databases").split(",")]
+    return list(get_mysql_settings().ignored_databases)
 
 def get_mysql_path():
-    return _get_config().get("mysql", "mysql_path")
+    return get_mysql_settings().mysql_path
 
 def get_mysqldump_path():
-    return _get_config().get("mysql", "mysqldump_path")
+    return get_mysql_settings().mysqldump_path
 
 def run_backups(config):
     """Main function to run database backups with the provided configuration."""
@@ -57,26 +113,6 @@ def run_backups(config):
         logger.critical(f"Permission error creating backup directory '{backup_dir}': {e}")
         sys.exit(1)
 
-# --- Spinner Class ---
-class Spinner:
-    def __init__(self, message="Working..."):
-        self.spinner = cycle(["-", "\\", "|", "/"])
-        self.message = message
-        self.running = False
-
-    def start(self):
-        self.running = True
-        threading.Thread(target=self._spin, daemon=True).start()
-
-    def _spin(self):
-        while self.running:
-            print(f"\r{self.message} {next(self.spinner)}", end="", flush=True)
-            time.sleep(0.1)
-
-    def stop(self):
-        self.running = False
-        print("\r", end="")
-
 def format_size(size: int) -> str:
     if size < 1024:
         return f"{size} B"
@@ -89,12 +125,12 @@ def format_size(size: int) -> str:
 
 def create_temp_mysql_config() -> str:
     """Create a temporary MySQL configuration file with credentials."""
-    config = get_config()
+    mysql_settings = get_mysql_settings()
     tmp = tempfile.NamedTemporaryFile(mode="w", delete=False)
     tmp.write("[client]\n")
-    tmp.write(f"user = {config.get('mysql', 'user')}\n")
-    tmp.write(f"password = {config.get('mysql', 'password')}\n")
-    tmp.write(f"host = {config.get('mysql', 'host')}\n")
+    tmp.write(f"user = {mysql_settings.user}\n")
+    tmp.write(f"password = {mysql_settings.password}\n")
+    tmp.write(f"host = {mysql_settings.host}\n")
     tmp.close()
     return tmp.name
 
@@ -108,10 +144,92 @@ def get_client_config_path():
 # Global variable for client config path (lazy-loaded)
 _client_config_path = None
 
+# Option files the mysql client reads before and after --defaults-extra-file
+_MYSQL_GLOBAL_OPTION_FILES = ("/etc/my.cnf", "/etc/mysql/my.cnf")
+_MYSQL_USER_OPTION_FILE = "~/.my.cnf"
+# Obfuscated login-path file the mysql client reads last; the connector cannot read it
+_MYSQL_LOGIN_PATH_FILE = "~/.mylogin.cnf"
+
+def _unreadable_option_files() -> list:
+    """
+    Return the option files the mysql client would read but the connector does
+    not: $MYSQL_HOME/my.cnf and the login-path file.
+    """
+    paths = []
+    mysql_home = os.environ.get("MYSQL_HOME")
+    if mysql_home:
+        paths.append(os.path.join(mysql_home, "my.cnf"))
+    paths.append(os.path.expanduser(os.environ.get("MYSQL_TEST_LOGIN_FILE", _MYSQL_LOGIN_PATH_FILE)))
+    return [path for path in paths if os.path.isfile(path)]
+
+def get_mysql_connection():
+    """
+    Get a persistent mysql.connector connection for metadata queries.
+    Returns None when mysql-connector-python is not installed, cannot connect,
+    would reach localhost over TCP instead of the client's Unix socket or
+    cannot see every option file the client reads, in which case callers fall
+    back to the mysql command-line client.
+    """
+    global _mysql_connection, _mysql_connection_attempted
+    if not _mysql_connection_attempted:
+        _mysql_connection_attempted = True
+        try:
+            import mysql.connector
+        except ImportError:
+            logger.debug("mysql-connector-python not installed, using the mysql client for queries")
+            return None
+        unreadable = _unreadable_option_files()
+        if unreadable:
+            # Settings in these files (e.g. a login-path host) would only apply to mysqldump
+            logger.debug(f"Option files {unreadable} not readable by mysql.connector, using the mysql client for queries")
+            return None
+        # Read the same option files, in the same order (later ones win), as the
+        # mysql client run with --defaults-extra-file, so both reach the same server
+        option_files = [path for path in _MYSQL_GLOBAL_OPTION_FILES if os.path.isfile(path)]
+        option_files.append(get_client_config_path())
+        user_option_file = os.path.expanduser(_MYSQL_USER_OPTION_FILE)
+        if os.path.isfile(user_option_file):
+            option_files.append(user_option_file)
+        try:
+            from mysql.connector.optionfiles import read_option_files
+            options = read_option_files(option_files=option_files, option_groups=["client", "mysql"])
+            if options.get("host", "localhost") == "localhost" and "unix_socket" not in options:
+                # The mysql client reaches localhost through its compiled-in default socket,
+                # while the connector would use TCP and might reach a different server
+                logger.debug("No socket configured for localhost, using the mysql client for queries")
+                return None
+            _mysql_connection = mysql.connector.connect(**options)
+        except Exception as e:
+            logger.warning(f"mysql.connector connection failed, falling back to the mysql client: {e}")
+    return _mysql_connection
+
+def close_mysql_connection() -> None:
+    """Close the persistent metadata connection, if one was opened."""
+    global _mysql_connection, _mysql_connection_attempted
+    if _mysql_connection is not None:
+        try:
+            _mysql_connection.close()
+        except Exception as e:
+            logger.debug(f"Error closing MySQL connection: {e}")
+    _mysql_connection = None
+    _mysql_connection_attempted = False
+
+# Global persistent metadata connection (lazy-loaded)
+_mysql_connection = None
+_mysql_connection_attempted = False
+
 def check_mysql_connection() -> None:
     logger.debug("Testing MySQL connection...")
-    config = get_config()
-    mysql_path = config.get("mysql", "mysql_path")
+    conn = get_mysql_connection()
+    if conn is not None:
+        try:
+            conn.ping(reconnect=True)
+            logger.info("MySQL connection successful")
+            print(f"{GREEN}MySQL connection successful.{RESET}")
+            return
+        except Exception as e:
+            logger.warning(f"MySQL ping failed, retrying with the mysql client: {e}")
+    mysql_path = get_mysql_path()
     client_config_path = get_client_config_path()
     try:
         subprocess.run(
@@ -131,8 +249,20 @@ def check_mysql_connection() -> None:
 
 def get_all_databases() -> list:
     logger.debug("Retrieving list of all databases")
-    config = get_config()
-    mysql_path = config.get("mysql", "mysql_path")
+    conn = get_mysql_connection()
+    if conn is not None:
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SHOW DATABASES")
+                databases = [row[0] for row in cursor]
+            finally:
+                cursor.close()
+            logger.info(f"Found {len(databases)} databases")
+            return databases
+        except Exception as e:
+            logger.warning(f"Listing databases failed, retrying with the mysql client: {e}")
+    mysql_path = get_mysql_path()
     client_config_path = get_client_config_path()
     try:
         result = subprocess.run(
@@ -151,206 +281,457 @@ def get_all_databases() -> list:
         print(f"{RED}Error retrieving databases: {e.stderr}{RESET}")
         sys.exit(1)
 
+def get_dump_cmd_base() -> tuple:
+    """
+    Get the mysqldump command line shared by every database (everything but
+    the database name), building it from the config on first use.
+    """
+    global _dump_cmd_base
+    if _dump_cmd_base is None:
+        export_settings = get_export_settings()
+        dump_cmd = [
+            get_mysqldump_path(),
+            f"--defaults-extra-file={get_client_config_path()}",
+            "--default-character-set=utf8mb4",
+            "--single-transaction",
+            "--force",
+            "--opt",
+            # Stream rows instead of buffering whole tables, and send them in
+            # large packets / multi-row INSERTs
+            "--quick",
+            "--net-buffer-length=1048576",
+            "--max-allowed-packet=1073741824"
+        ]
+        if export_settings.include_routines:
+            dump_cmd.append("--routines")
+        if export_settings.include_events:
+            dump_cmd.append("--events")
+        if not export_settings.column_statistics:
+            dump_cmd.append("--column-statistics=0")
+        _dump_cmd_base = tuple(dump_cmd)
+    return _dump_cmd_base
+
+# Global mysqldump base command (lazy-loaded)
+_dump_cmd_base = None
+
+def _compile_ignored_patterns(patterns: list):
+    """
+    Combine the ignored_databases wildcard patterns into a single regex.
+    Returns None when no patterns are configured.
+    """
+    patterns = [p for p in patterns if p]
+    if not patterns:
+        return None
+    # fnmatch() compares case-insensitively where the OS does (e.g. Windows)
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns), flags)
+
+def get_ignored_db_regex():
+    """Get the compiled ignored_databases regex, building it on first use."""
+    global _ignored_db_regex, _ignored_db_regex_ready
+    if not _ignored_db_regex_ready:
+        _ignored_db_regex = _compile_ignored_patterns(get_ignored_db_patterns())
+        _ignored_db_regex_ready = True
+    return _ignored_db_regex
+
+# Global compiled ignore pattern (lazy-loaded)
+_ignored_db_regex = None
+_ignored_db_regex_ready = False
+
 def is_ignored(db_name: str) -> bool:
     """
     Return True if db_name matches any of the patterns in ignored_databases config.
-    We use fnmatch to support wildcards (like projekti_*).
+    We use fnmatch-style wildcards (like projekti_*), compiled once into one regex.
     """
-    ignored_patterns = get_ignored_db_patterns()
-    for pattern in ignored_patterns:
-        if fnmatch(db_name, pattern):
-            logger.debug(f"Database '{db_name}' ignored (matches pattern '{pattern}')")
-            return True
+    ignored_regex = get_ignored_db_regex()
+    if ignored_regex is not None and ignored_regex.match(db_name) is not None:
+        logger.debug(f"Database '{db_name}' ignored (matches ignored_databases)")
+        return True
     return False
 
+def _enlarge_pipe(pipe) -> None:
+    """Grow the kernel buffer of the dump pipe so every read moves more data."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, _PIPE_SIZE)
+    except OSError as e:
+        logger.debug(f"Could not enlarge dump pipe buffer: {e}")
+
+class _CountingReader:
+    """Wrap a dump stream and count the bytes read through it."""
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self.bytes_read += len(data)
+        return data
+
+class _InterruptibleReader:
+    """Wrap a file so reading it stops once the backup run is interrupted."""
+    def __init__(self, stream):
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if _stop_requested.is_set():
+            raise _BackupInterrupted("backup interrupted")
+        return self._stream.read(size)
+
+def _start_dump(dump_cmd: list) -> subprocess.Popen:
+    """
+    Launch mysqldump in its own session and register it as in flight.
+    Keeping it out of our process group means a Ctrl-C is handled by
+    run_backups, which then stops every running dump at once. Starting under
+    the lock means a dump either is stopped by the interrupt or never starts.
+    """
+    with _active_dumps_lock:
+        if _stop_requested.is_set():
+            raise _BackupInterrupted("backup interrupted")
+        proc = subprocess.Popen(dump_cmd, stdout=subprocess.PIPE, bufsize=0, start_new_session=True)
+        _active_dumps.add(proc)
+    return proc
+
+def _finish_dump(proc: subprocess.Popen) -> int:
+    """Close the dump pipe, reap mysqldump and return its exit code."""
+    try:
+        # Closing the pipe first unblocks mysqldump if the copy bailed out early
+        proc.stdout.close()
+        return proc.wait()
+    finally:
+        with _active_dumps_lock:
+            _active_dumps.discard(proc)
+
+def _terminate_active_dumps() -> None:
+    """Send SIGTERM to the process group of every mysqldump still running."""
+    with _active_dumps_lock:
+        procs = list(_active_dumps)
+    for proc in procs:
+        try:
+            if os.name == "posix":
+                os.killpg(proc.pid, signal.SIGTERM)
+            else:
+                proc.terminate()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+def _print_message(text: str) -> None:
+    """Print text from a backup worker, around the progress bar if one is shown."""
+    with _print_lock:
+        if _progress_bar is not None:
+            with _progress_bar.external_write_mode():
+                print(text)
+        else:
+            print(text)
+
+def _remove_partial_archive(archive_file) -> None:
+    """Delete an archive left behind by a failed dump so it is never uploaded."""
+    if not archive_file:
+        return
+    try:
+        os.remove(archive_file)
+    except FileNotFoundError:
+        return
+    logger.debug(f"Removed incomplete archive: {archive_file}")
+
+def _stream_gz(dump_stream, archive_file: str, db: str, settings) -> None:
+    with open(archive_file, "wb", buffering=_COPY_BUFSIZE) as raw_out, \
+            gzip.GzipFile(fileobj=raw_out, mode="wb", compresslevel=settings.gz_level) as f_out:
+        shutil.copyfileobj(dump_stream, f_out, _COPY_BUFSIZE)
+
+def _stream_xz(dump_stream, archive_file: str, db: str, settings) -> None:
+    with open(archive_file, "wb", buffering=_COPY_BUFSIZE) as raw_out, \
+            lzma.open(raw_out, "wb", preset=settings.xz_preset) as f_out:
+        shutil.copyfileobj(dump_stream, f_out, _COPY_BUFSIZE)
+
+def _stream_zstd(dump_stream, archive_file: str, db: str, settings) -> None:
+    import zstandard
+    cctx = zstandard.ZstdCompressor(level=settings.zstd_level, threads=-1)
+    with open(archive_file, "wb", buffering=_COPY_BUFSIZE) as raw_out, \
+            cctx.stream_writer(raw_out) as f_out:
+        shutil.copyfileobj(dump_stream, f_out, _COPY_BUFSIZE)
+
+def _stream_lz4(dump_stream, archive_file: str, db: str, settings) -> None:
+    import lz4.frame
+    with open(archive_file, "wb", buffering=_COPY_BUFSIZE) as raw_out, \
+            lz4.frame.open(raw_out, "wb", block_size=lz4.frame.BLOCKSIZE_MAX4MB) as f_out:
+        shutil.copyfileobj(dump_stream, f_out, _COPY_BUFSIZE)
+
+def _stream_zip(dump_stream, archive_file: str, db: str, settings) -> None:
+    with open(archive_file, "wb", buffering=_COPY_BUFSIZE) as raw_out, \
+            zipfile.ZipFile(raw_out, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
+        with zipf.open(f"{db}-{TIMESTAMP}.sql", "w", force_zip64=True) as f_out:
+            shutil.copyfileobj(dump_stream, f_out, _COPY_BUFSIZE)
+
+def _archive_tarxz(sql_file: str, archive_file: str, settings) -> None:
+    with open(sql_file, "rb") as f_in, \
+            tarfile.open(archive_file, "w:xz", preset=settings.xz_preset) as tar:
+        tarinfo = tar.gettarinfo(sql_file, arcname=os.path.basename(sql_file))
+        # Compressing a large dump takes a while; give up on it after Ctrl-C
+        tar.addfile(tarinfo, _InterruptibleReader(f_in))
+
+def _archive_rar(sql_file: str, archive_file: str, settings) -> None:
+    result = subprocess.run(["rar", "a", archive_file, sql_file])
+    if result.returncode != 0:
+        # Not a CalledProcessError, which backup_database reports as a dump failure
+        raise RuntimeError(f"rar exited with status {result.returncode}")
+
+# Formats compressed on the fly while mysqldump is still writing
+_STREAM_ARCHIVERS = {
+    "gz": _stream_gz,
+    "xz": _stream_xz,
+    "zstd": _stream_zstd,
+    "lz4": _stream_lz4,
+    "zip": _stream_zip,
+}
+
+# Formats that need the complete dump on disk first (tar headers carry the
+# member size, rar is an external tool); "none" keeps the staged file as-is.
+_STAGED_ARCHIVERS = {
+    "none": None,
+    "tar.xz": _archive_tarxz,
+    "rar": _archive_rar,
+}
+
 def backup_database(db: str) -> tuple:
     """
     Dump the given database, archive it, and return a tuple:
       (status, dump_size, archive_size)
+    The mysqldump output is streamed straight into the archive where the
+    format allows it, so no intermediate .sql file is written.
     """
     logger.info(f"Starting backup for database: {db}")
-    config = get_config()
-    backup_dir = config.get("backup", "backup_dir")
-    mysqldump_path = config.get("mysql", "mysqldump_path")
-    client_config_path = get_client_config_path()
-    archive_format = config.get("backup", "archive_format").lower()
+    backup_settings = get_backup_settings()
+    backup_dir = backup_settings.backup_dir
+    archive_format = backup_settings.archive_format
     
     status = "Success"
-    temp_sql_file = os.path.join(backup_dir, f"{db}-{TIMESTAMP}.sql")
-    dump_cmd = [
-        mysqldump_path,
-        f"--defaults-extra-file={client_config_path}",
-        "--default-character-set=utf8mb4",
-        "--single-transaction",
-        "--force",
-        "--opt"
-    ]
-    if config.has_section("export") and config.getboolean("export", "include_routines", fallback=False):
-        dump_cmd.append("--routines")
-    if config.has_section("export") and config.getboolean("export", "include_events", fallback=False):
-        dump_cmd.append("--events")
-    if config.has_section("export") and not config.getboolean("export", "column_statistics", fallback=True):
-        dump_cmd.append("--column-statistics=0")
-    dump_cmd.extend(["--databases", db])
+    dump_cmd = [*get_dump_cmd_base(), "--databases", db]
     
     logger.debug(f"Dump command: {' '.join(dump_cmd)}")
     
-    spinner = Spinner(f"Dumping {db}")
-    spinner.start()
+    if archive_format not in ARCHIVE_EXTENSIONS:
+        logger.warning(f"Unknown archive format: {archive_format}. Using plain backup (none).")
+        _print_message(f"{RED}Unknown archive format: {archive_format}. Using plain backup (none).{RESET}")
+        archive_format = "none"
+
+    base_path = os.path.join(backup_dir, f"{db}-{TIMESTAMP}")
+    temp_sql_file = None
+    archive_file = None
     try:
-        with open(temp_sql_file, "w") as f:
-            subprocess.run(dump_cmd, check=True, stdout=f)
-        spinner.stop()
-        dump_size = os.path.getsize(temp_sql_file) if os.path.exists(temp_sql_file) else 0
+        proc = _start_dump(dump_cmd)
+        _enlarge_pipe(proc.stdout)
+        dump_stream = _CountingReader(proc.stdout)
+        stream_archiver = _STREAM_ARCHIVERS.get(archive_format)
+        try:
+            if stream_archiver is not None:
+                archive_file = f"{base_path}.{ARCHIVE_EXTENSIONS[archive_format]}"
+                stream_archiver(dump_stream, archive_file, db, backup_settings)
+            else:
+                temp_sql_file = f"{base_path}.sql"
+                with open(temp_sql_file, "wb", buffering=_COPY_BUFSIZE) as f_out:
+                    shutil.copyfileobj(dump_stream, f_out, _COPY_BUFSIZE)
+        finally:
+            returncode = _finish_dump(proc)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, dump_cmd)
+        dump_size = dump_stream.bytes_read
         logger.debug(f"Database {db} dumped successfully, size: {format_size(dump_size)}")
 
         if archive_format == "none":
-            archive_file = temp_sql_file
+            archive_file, temp_sql_file = temp_sql_file, None
             archive_size = dump_size
             logger.debug(f"No compression applied for {db}")
-        elif archive_format == "gz":
-            archive_file = os.path.join(backup_dir, f"{db}-{TIMESTAMP}.sql.gz")
-            import gzip
-            with open(temp_sql_file, "rb") as f_in, open(archive_file, "wb") as f_out:
-                with gzip.GzipFile(fileobj=f_out, mode="wb") as gz_out:
-                    gz_out.writelines(f_in)
-            archive_size = os.path.getsize(archive_file)
-            logger.debug(f"Database {db} compressed with gzip, size: {format_size(archive_size)}")
-        elif archive_format == "xz":
-            archive_file = os.path.join(backup_dir, f"{db}-{TIMESTAMP}.sql.xz")
-            import lzma
-            with open(temp_sql_file, "rb") as f_in, lzma.open(archive_file, "wb") as f_out:
-                f_out.write(f_in.read())
-            archive_size = os.path.getsize(archive_file)
-            logger.debug(f"Database {db} compressed with xz, size: {format_size(archive_size)}")
-        elif archive_format == "tar.xz":
-            archive_file = os.path.join(backup_dir, f"{db}-{TIMESTAMP}.tar.xz")
-            with tarfile.open(archive_file, "w:xz") as tar:
-                tar.add(temp_sql_file, arcname=os.path.basename(temp_sql_file))
-            archive_size = os.path.getsize(archive_file)
-            logger.debug(f"Database {db} compressed with tar.xz, size: {format_size(archive_size)}")
-        elif archive_format == "zip":
-            archive_file = os.path.join(backup_dir, f"{db}-{TIMESTAMP}.zip")
-            import zipfile
-            with zipfile.ZipFile(archive_file, "w", compression=zipfile.ZIP_DEFLATED) as zipf:
-                zipf.write(temp_sql_file, arcname=os.path.basename(temp_sql_file))
-            archive_size = os.path.getsize(archive_file)
-            logger.debug(f"Database {db} compressed with zip, size: {format_size(archive_size)}")
-        elif archive_format == "rar":
-            archive_file = os.path.join(backup_dir, f"{db}-{TIMESTAMP}.rar")
-            try:
-                subprocess.run(["rar", "a", archive_file, temp_sql_file], check=True)
-                archive_size = os.path.getsize(archive_file)
-                logger.debug(f"Database {db} compressed with rar, size: {format_size(archive_size)}")
-            except Exception as e:
-                spinner.stop()
-                logger.error(f"Error archiving {db} with rar: {e}")
-                print(f"\n{RED}Error archiving {db} with rar: {e}{RESET}")
-                status = "Error"
-                archive_size = 0
         else:
-            logger.warning(f"Unknown archive format: {archive_format}. Using plain backup (none).")
-            print(f"{RED}Unknown archive format: {archive_format}. Using plain backup (none).{RESET}")
-            archive_file = temp_sql_file
-            archive_size = dump_size
+            if stream_archiver is None:
+                if _stop_requested.is_set():
+                    raise _BackupInterrupted("backup interrupted")
+                archive_file = f"{base_path}.{ARCHIVE_EXTENSIONS[archive_format]}"
+                _STAGED_ARCHIVERS[archive_format](temp_sql_file, archive_file, backup_settings)
+            archive_size = os.path.getsize(archive_file)
+            logger.debug(f"Database {db} compressed with {archive_format}, size: {format_size(archive_size)}")
+    except _BackupInterrupted:
+        logger.warning(f"Backup of {db} interrupted")
+        _remove_partial_archive(archive_file)
+        status = "Error"
+        dump_size = 0
+        archive_size = 0
     except subprocess.CalledProcessError as e:
-        spinner.stop()
         logger.error(f"Error dumping {db}: {e}")
-        print(f"\n{RED}Error dumping {db}: {e}{RESET}")
+        _print_message(f"\n{RED}Error dumping {db}: {e}{RESET}")
+        _remove_partial_archive(archive_file)
         status = "Error"
         dump_size = 0
         archive_size = 0
     except Exception as e:
-        spinner.stop()
         logger.error(f"Error archiving {db}: {e}")
-        print(f"\n{RED}Error archiving {db}: {e}{RESET}")
+        _print_message(f"\n{RED}Error archiving {db}: {e}{RESET}")
+        _remove_partial_archive(archive_file)
         status = "Error"
         dump_size = 0
         archive_size = 0
     finally:
-        if archive_format != "none" and os.path.exists(temp_sql_file):
-            os.remove(temp_sql_file)
-            logger.debug(f"Temporary SQL file removed for {db}")
+        if temp_sql_file is not None:
+            try:
+                os.remove(temp_sql_file)
+                logger.debug(f"Temporary SQL file removed for {db}")
+            except FileNotFoundError:
+                pass
     
     logger.info(f"Backup completed for {db}: {status}")
     return status, dump_size, archive_size
 
+@functools.lru_cache(maxsize=32)
 def should_upload(schedule: str) -> bool:
     """
     Determine if the current day meets the upload schedule criteria.
     Supported values: "daily", "first_day", "last_day", weekday names, or a numeric day.
     """
-    from datetime import datetime
-    import calendar
-    now = datetime.now()
     schedule = schedule.lower().strip()
     if schedule == "daily":
         return True
     elif schedule == "first_day":
-        return now.day == 1
+        return _TODAY.day == 1
     elif schedule == "last_day":
-        last_day = calendar.monthrange(now.year, now.month)[1]
-        return now.day == last_day
-    elif schedule in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]:
-        return now.strftime("%A").lower() == schedule
+        return _TODAY.day == _LAST_DAY_OF_MONTH
+    elif schedule in _WEEKDAYS:
+        return _TODAY_WEEKDAY == schedule
     else:
         try:
             day = int(schedule)
-            return now.day == day
+            return _TODAY.day == day
         except ValueError:
             return False
 
 def print_table_header() -> None:
-    header = f"| {'Database':25} | {'Status':15} | {'Time (s)':10} | {'Dump Size':12} | {'Archive Size':12} |"
-    separator = f"|{'-'*27}|{'-'*17}|{'-'*12}|{'-'*14}|{'-'*16}|"
-    print(header)
-    print(separator)
+    sys.stdout.write(_TABLE_HEADER)
 
 def print_table_row(db: str, status: str, elapsed: str, dump_size: int, archive_size: int) -> None:
     if status == "Success":
-        color = GREEN
         dump_str = format_size(dump_size)
         archive_str = format_size(archive_size)
     elif status == "Error":
-        color = RED
         dump_str = "N/A"
         archive_str = "N/A"
     else:
-        color = YELLOW
         dump_str = "-"
         archive_str = "-"
-    print(f"| {db:25} | {color}{status:15}{RESET} | {elapsed:10} | {dump_str:12} | {archive_str:12} |")
+    sys.stdout.write(_ROW_FMT.format_map({
+        "db": db,
+        "color": _STATUS_COLOR.get(status, YELLOW),
+        "status": status,
+        "elapsed": elapsed,
+        "dump": dump_str,
+        "archive": archive_str,
+    }))
+
+def _create_progress_bar(total: int):
+    """
+    Return a tqdm progress bar for the backup run, or None when stdout is not
+    a terminal or tqdm is not installed.
+    """
+    if not sys.stdout.isatty():
+        return None
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        return None
+    return tqdm(total=total, unit="db", desc="Backing up", leave=False)
+
+def _install_sigint_handler(handler):
+    """
+    Install handler for SIGINT and return the previous one, or None when
+    signals cannot be handled here (run_backups called from a worker thread).
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return None
+    previous = signal.signal(signal.SIGINT, handler)
+    return signal.SIG_DFL if previous is None else previous
+
+def _timed_backup(db: str) -> tuple:
+    """Run backup_database for db and append the elapsed wall-clock time in seconds."""
+    start = time.perf_counter()
+    status, dump_size, archive_size = backup_database(db)
+    return status, dump_size, archive_size, time.perf_counter() - start
 
 def run_backups(config) -> tuple:
     """
     Run backups for all databases and return a tuple:
       (list_of_errors, summary_message)
+    Databases are dumped in parallel by a pool of worker threads; the pool size
+    comes from the "parallel" option in the [backup] section (default 4).
     """
+    global _progress_bar
     logger.info("Starting backup process")
     check_mysql_connection()
     databases = get_all_databases()
+    close_mysql_connection()
     errors = []
     summary_lines = []
+    max_workers = build_backup_settings(config).parallel
+    # Build the shared dump command before the workers start using it
+    get_dump_cmd_base()
     
     logger.info(f"Processing {len(databases)} databases")
-    print_table_header()
+    pending = []
+    skipped = []
     for db in databases:
         if is_ignored(db):
             logger.debug(f"Skipping database: {db} (ignored)")
-            print_table_row(db, "Skipped", "-", "-", "-")
-            continue
-
-        start = time.time()
-        status, dump_size, archive_size = backup_database(db)
-        elapsed = f"{time.time() - start:.1f}"
-        if status == "Error":
-            errors.append(db)
-        
-        print_table_row(db, status, elapsed, dump_size, archive_size)
-        summary_lines.append(f"{db}: {status} in {elapsed}s")
+            skipped.append(db)
+        else:
+            pending.append(db)
+
+    print(f"{BLUE}Backing up {len(pending)} databases ({len(skipped)} skipped) with {max_workers} parallel workers...{RESET}")
+    print_table_header()
+    for db in skipped:
+        print_table_row(db, "Skipped", "-", "-", "-")
+
+    progress = _progress_bar = _create_progress_bar(len(pending))
+    futures = {}
+
+    def _on_interrupt(signum, frame):
+        logger.warning("Backup interrupted, stopping running dumps")
+        _stop_requested.set()
+        for future in futures:
+            future.cancel()
+        _terminate_active_dumps()
+        raise KeyboardInterrupt
+
+    previous_handler = _install_sigint_handler(_on_interrupt)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for db in pending:
+                futures[executor.submit(_timed_backup, db)] = db
+            for done, future in enumerate(as_completed(futures), 1):
+                db = futures[future]
+                status, dump_size, archive_size, elapsed = future.result()
+                elapsed = f"{elapsed:.1f}"
+                if status == "Error":
+                    errors.append(db)
+                
+                with _print_lock:
+                    if progress is not None:
+                        with progress.external_write_mode():
+                            print_table_row(db, status, elapsed, dump_size, archive_size)
+                        progress.update(1)
+                    else:
+                        print_table_row(db, status, elapsed, dump_size, archive_size)
+                        # stderr, so the progress lines stay out of the table on stdout
+                        print(f"[{done}/{len(pending)}] {db} … {status}", file=sys.stderr, flush=True)
+                summary_lines.append(f"{db}: {status} in {elapsed}s")
+    finally:
+        if previous_handler is not None:
+            signal.signal(signal.SIGINT, previous_handler)
+        # The pool has shut down, so no worker is left to see the flag
+        _stop_requested.clear()
+        if progress is not None:
+            progress.close()
+        _progress_bar = None
     
-    separator = f"|{'-'*27}|{'-'*17}|{'-'*12}|{'-'*14}|{'-'*16}|"
-    print(separator)
+    sys.stdout.write(_TABLE_SEPARATOR)
+    sys.stdout.flush()
     summary = "\n".join(summary_lines)
     
     if errors:
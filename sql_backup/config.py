@@ -1,6 +1,7 @@
 import configparser
 import os
 import sys
+from typing import NamedTuple, Tuple
 from .logger import setup_logging, get_logger
 from .config_validator import validate_configuration, ConfigurationError
 
@@ -56,3 +57,96 @@ def get_config():
     if CONFIG is None:
         CONFIG = load_config()
     return CONFIG
+
+
+# --- Typed section snapshots ---
+# Parsed once from the config so hot paths use plain attribute access instead
+# of configparser lookups (and their interpolation) on every call.
+
+class BackupSettings(NamedTuple):
+    """Values from the [backup] section."""
+    backup_dir: str
+    archive_format: str
+    parallel: int
+    gz_level: int
+    zstd_level: int
+    xz_preset: int
+
+
+class MysqlSettings(NamedTuple):
+    """Values from the [mysql] section."""
+    user: str
+    password: str
+    host: str
+    mysql_path: str
+    mysqldump_path: str
+    ignored_databases: Tuple[str, ...]
+
+
+class ExportSettings(NamedTuple):
+    """Values from the optional [export] section."""
+    include_routines: bool
+    include_events: bool
+    column_statistics: bool
+
+
+def build_backup_settings(config) -> BackupSettings:
+    """Build BackupSettings from a ConfigParser instance."""
+    return BackupSettings(
+        backup_dir=config.get("backup", "backup_dir"),
+        archive_format=config.get("backup", "archive_format").lower(),
+        parallel=config.getint("backup", "parallel", fallback=4),
+        gz_level=config.getint("backup", "gz_level", fallback=6),
+        zstd_level=config.getint("backup", "zstd_level", fallback=3),
+        xz_preset=config.getint("backup", "xz_preset", fallback=6)
+    )
+
+
+def build_mysql_settings(config) -> MysqlSettings:
+    """Build MysqlSettings from a ConfigParser instance."""
+    ignored = config.get("mysql", "ignored_databases", fallback="")
+    return MysqlSettings(
+        user=config.get("mysql", "user"),
+        password=config.get("mysql", "password"),
+        host=config.get("mysql", "host"),
+        mysql_path=config.get("mysql", "mysql_path"),
+        mysqldump_path=config.get("mysql", "mysqldump_path"),
+        ignored_databases=tuple(p.strip() for p in ignored.split(",") if p.strip())
+    )
+
+
+def build_export_settings(config) -> ExportSettings:
+    """Build ExportSettings from a ConfigParser instance."""
+    has_export = config.has_section("export")
+    return ExportSettings(
+        include_routines=has_export and config.getboolean("export", "include_routines", fallback=False),
+        include_events=has_export and config.getboolean("export", "include_events", fallback=False),
+        column_statistics=not has_export or config.getboolean("export", "column_statistics", fallback=True)
+    )
+
+
+# Cached settings for the global configuration - lazy loaded
+BACKUP_SETTINGS = None
+MYSQL_SETTINGS = None
+EXPORT_SETTINGS = None
+
+def get_backup_settings() -> BackupSettings:
+    """Get the [backup] settings of the global configuration."""
+    global BACKUP_SETTINGS
+    if BACKUP_SETTINGS is None:
+        BACKUP_SETTINGS = build_backup_settings(get_config())
+    return BACKUP_SETTINGS
+
+def get_mysql_settings() -> MysqlSettings:
+    """Get the [mysql] settings of the global configuration."""
+    global MYSQL_SETTINGS
+    if MYSQL_SETTINGS is None:
+        MYSQL_SETTINGS = build_mysql_settings(get_config())
+    return MYSQL_SETTINGS
+
+def get_export_settings() -> ExportSettings:
+    """Get the [export] settings of the global configuration."""
+    global EXPORT_SETTINGS
+    if EXPORT_SETTINGS is None:
+        EXPORT_SETTINGS = build_export_settings(get_config())
+    return EXPORT_SETTINGS
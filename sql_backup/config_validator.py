@@ -6,7 +6,7 @@ Provides comprehensive validation of configuration parameters with detailed erro
 import os
 import re
 import configparser
-from typing import Dict, List, Tuple, Any, Optional
+from typing import List, NamedTuple, Tuple
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,6 +17,15 @@ class ConfigurationError(Exception):
     pass
 
 
+class ValidationReport(NamedTuple):
+    """Result of get_validation_report()."""
+    is_valid: bool
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+    error_count: int
+    warning_count: int
+
+
 class ConfigValidator:
     """Comprehensive configuration validator for sqlBackup."""
     
@@ -33,7 +42,7 @@ class ConfigValidator:
         
         # Define valid values for specific fields
         self.valid_values = {
-            'archive_format': ['none', 'gz', 'xz', 'tar.xz', 'zip', 'rar'],
+            'archive_format': ['none', 'gz', 'xz', 'tar.xz', 'zip', 'rar', 'zstd', 'lz4'],
             'protocol': ['sftp', 'ftp', 'scp'],
             'level': ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
             'provider': ['twilio']
@@ -42,8 +51,13 @@ class ConfigValidator:
         # Define field types
         self.field_types = {
             'backup_retention_days': int,
+            'parallel': int,
+            'gz_level': int,
+            'zstd_level': int,
+            'xz_preset': int,
             'smtp_port': int,
             'port': int,
+            'sftp_workers': int,
             'min_api_version': int,
             'enabled': bool,
             'enable_console': bool,
@@ -77,6 +91,12 @@ class ConfigValidator:
         self.errors = []
         self.warnings = []
         
+        # Values that can't be interpolated can't be read at all, so stop here
+        self._validate_interpolation(config)
+        if self.errors:
+            logger.error(f"Configuration validation failed with {len(self.errors)} errors")
+            return False, self.errors, self.warnings
+        
         # Validate required sections and fields
         self._validate_required_sections(config)
         
@@ -108,6 +128,15 @@ class ConfigValidator:
             
         return is_valid, self.errors, self.warnings
     
+    def _validate_interpolation(self, config: configparser.ConfigParser):
+        """Validate that every value can be read with '%' interpolation."""
+        for section_name in config.sections():
+            for option in config.options(section_name):
+                try:
+                    config.get(section_name, option)
+                except configparser.InterpolationError as e:
+                    self.errors.append(f"Invalid value for '{option}' in section [{section_name}]: {e.message}")
+    
     def _validate_required_sections(self, config: configparser.ConfigParser):
         """Validate that required sections and fields exist."""
         for section_name, required_fields in self.required_sections.items():
@@ -144,6 +173,26 @@ class ConfigValidator:
                 self.warnings.append("backup_retention_days is very high (>365 days), ensure you have enough disk space")
         except ValueError:
             self.errors.append("backup_retention_days must be a valid integer")
+        
+        # Out-of-range values would only fail once a dump is being archived
+        self._validate_int_range(config, 'backup', 'gz_level', 0, 9)
+        self._validate_int_range(config, 'backup', 'zstd_level', 1, 22)
+        self._validate_int_range(config, 'backup', 'xz_preset', 0, 9)
+        try:
+            if config.getint('backup', 'parallel', fallback=4) < 1:
+                self.errors.append("parallel must be at least 1")
+        except ValueError:
+            pass  # Reported by _validate_field_types
+    
+    def _validate_int_range(self, config: configparser.ConfigParser, section: str, option: str,
+                            minimum: int, maximum: int):
+        """Validate that an optional integer option lies between minimum and maximum."""
+        try:
+            value = config.getint(section, option, fallback=None)
+        except ValueError:
+            return  # Reported by _validate_field_types
+        if value is not None and not minimum <= value <= maximum:
+            self.errors.append(f"{option} must be between {minimum} and {maximum}")
     
     def _validate_mysql_section(self, config: configparser.ConfigParser):
         """Validate MySQL section parameters."""
@@ -280,7 +329,9 @@ class ConfigValidator:
     
     def _validate_sms_config(self, config: configparser.ConfigParser):
         """Validate SMS notification configuration."""
-        required_fields = ['account_sid', 'auth_token', 'from_number', 'to_numbers']
+        required_fields = ['account_sid', 'auth_token', 'to_numbers']
+        if not config.get('sms', 'messaging_service_sid', fallback='').strip():
+            required_fields.insert(2, 'from_number')
         
         for field in required_fields:
             if not config.get('sms', field, fallback=''):
@@ -397,6 +448,19 @@ class ConfigValidator:
             except ImportError:
                 self.warnings.append("SFTP protocol selected but paramiko library not available. Install with: pip install paramiko")
         
+        # zstd and lz4 archives rely on optional compression libraries
+        archive_format = config.get('backup', 'archive_format', fallback='').lower()
+        if archive_format == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                self.warnings.append("zstd archive format selected but zstandard library not available. Install with: pip install zstandard")
+        elif archive_format == 'lz4':
+            try:
+                import lz4.frame
+            except ImportError:
+                self.warnings.append("lz4 archive format selected but lz4 library not available. Install with: pip install lz4")
+        
         # If SMS notifications are enabled, check for twilio
         if (config.has_section('sms') and 
             config.getboolean('sms', 'enabled', fallback=False)):
@@ -445,7 +509,7 @@ def validate_configuration(config: configparser.ConfigParser) -> None:
     logger.info("Configuration validation completed successfully")
 
 
-def get_validation_report(config: configparser.ConfigParser) -> Dict[str, Any]:
+def get_validation_report(config: configparser.ConfigParser) -> ValidationReport:
     """
     Get a detailed validation report without raising exceptions.
     
@@ -453,15 +517,15 @@ def get_validation_report(config: configparser.ConfigParser) -> Dict[str, Any]:
         config: ConfigParser instance to validate
         
     Returns:
-        Dictionary containing validation results
+        ValidationReport containing validation results
     """
     validator = ConfigValidator()
     is_valid, errors, warnings = validator.validate_config(config)
     
-    return {
-        'is_valid': is_valid,
-        'errors': errors,
-        'warnings': warnings,
-        'error_count': len(errors),
-        'warning_count': len(warnings)
-    }
+    return ValidationReport(
+        is_valid=is_valid,
+        errors=tuple(errors),
+        warnings=tuple(warnings),
+        error_count=len(errors),
+        warning_count=len(warnings)
+    )
@@ -1,5 +1,8 @@
 import requests
 import smtplib
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from .logger import get_logger
@@ -14,6 +17,18 @@ YELLOW = "\033[0;33m"
 GREEN = "\033[0;32m"
 RESET = "\033[0m"
 
+# Timeout (seconds) for HTTP notification requests
+HTTP_TIMEOUT = 10
+
+# Upper bound on concurrent Twilio requests when texting several recipients
+SMS_MAX_WORKERS = 8
+
+# Shared HTTP session so notifications reuse pooled keep-alive connections.
+# Retries only cover connection failures; POSTs are not re-sent once delivered.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                       max_retries=Retry(total=2, backoff_factor=0.3)))
+
 def send_telegram_notification(config, message: str) -> None:
     if config.has_section("telegram") and config.getboolean("telegram", "enabled", fallback=False):
         telegram_token = config.get("telegram", "telegram_token")
@@ -21,7 +36,7 @@ def send_telegram_notification(config, message: str) -> None:
         url = f"https://api.telegram.org/bot{telegram_token}/sendMessage"
         data = {"chat_id": telegram_chatid, "text": message}
         try:
-            response = requests.post(url, data=data)
+            response = _SESSION.post(url, data=data, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
             logger.info("Telegram notification sent successfully")
             print(f"{BLUE}Telegram notification sent.{RESET}")
@@ -62,7 +77,7 @@ def send_slack_notification(config, message):
         try:
             payload = {"text": message}
             # Note: use json=payload, not data=payload
-            response = requests.post(webhook_url, json=payload)
+            response = _SESSION.post(webhook_url, json=payload, timeout=HTTP_TIMEOUT)
             if response.status_code != 200:
                 logger.error(f"Slack notification failed: {response.text}")
                 print(f"Slack notification failed: {response.text}")
@@ -79,14 +94,35 @@ def send_sms_notification(config, message: str) -> None:
             from twilio.rest import Client
             account_sid = config.get("sms", "account_sid")
             auth_token = config.get("sms", "auth_token")
-            from_number = config.get("sms", "from_number")
+            # A Messaging Service picks the sender itself, so from_number is optional then
+            messaging_service_sid = config.get("sms", "messaging_service_sid", fallback="").strip()
+            if messaging_service_sid:
+                sender = {"messaging_service_sid": messaging_service_sid}
+            else:
+                sender = {"from_": config.get("sms", "from_number")}
             to_numbers = config.get("sms", "to_numbers").split(',')
             to_numbers = [num.strip() for num in to_numbers if num.strip()]
+            if not to_numbers:
+                logger.warning("SMS notification skipped: no recipients in to_numbers")
+                print(f"{YELLOW}SMS notification skipped: no recipients in to_numbers.{RESET}")
+                return
             client = Client(account_sid, auth_token)
-            for number in to_numbers:
-                client.messages.create(body=message, from_=from_number, to=number)
-            logger.info(f"SMS notification sent to {len(to_numbers)} recipients")
-            print(f"{BLUE}SMS notification sent.{RESET}")
+            with ThreadPoolExecutor(max_workers=min(SMS_MAX_WORKERS, len(to_numbers))) as executor:
+                futures = [executor.submit(client.messages.create, body=message, to=number, **sender)
+                           for number in to_numbers]
+                failed = []
+                for number, future in zip(to_numbers, futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"SMS notification to {number} failed: {e}")
+                        failed.append(number)
+            sent = len(to_numbers) - len(failed)
+            logger.info(f"SMS notification sent to {sent} of {len(to_numbers)} recipients")
+            if failed:
+                print(f"{RED}SMS notification failed for: {', '.join(failed)}{RESET}")
+            else:
+                print(f"{BLUE}SMS notification sent.{RESET}")
         except Exception as e:
             logger.error(f"SMS notification failed: {e}")
             print(f"{RED}SMS notification failed: {e}{RESET}")
@@ -109,7 +145,7 @@ def send_viber_notification(config, message: str) -> None:
             "text": message
         }
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = _SESSION.post(url, headers=headers, json=payload, timeout=HTTP_TIMEOUT)
             if response.status_code != 200:
                 logger.error(f"Viber notification failed: {response.text}")
                 print(f"{RED}Viber notification failed: {response.text}{RESET}")
@@ -125,38 +161,43 @@ def send_messenger_notification(config, message: str) -> None:
         logger.warning("Messenger notification not implemented yet")
         print(f"{YELLOW}Messenger notification not implemented yet.{RESET}")
 
+# Sender function for each notification channel name
+_DISPATCH = {
+    "telegram": send_telegram_notification,
+    "email": send_email_notification,
+    "slack": send_slack_notification,
+    "sms": send_sms_notification,
+    "viber": send_viber_notification,
+    "messenger": send_messenger_notification,
+}
+
+def _send_concurrently(senders: list, config, message: str) -> None:
+    """Run the given channel senders in parallel so a slow channel doesn't block the rest."""
+    if not senders:
+        return
+    with ThreadPoolExecutor(max_workers=len(senders)) as executor:
+        futures = [executor.submit(sender, config, message) for sender in senders]
+        for future in futures:
+            future.result()
+
 def notify_all(config, message: str) -> None:
     logger.info("Sending notifications to all enabled channels")
+    senders = []
     if config.has_section("notification"):
         channels = config.get("notification", "channels").split(',')
         channels = [ch.strip().lower() for ch in channels if ch.strip()]
         logger.debug(f"Configured notification channels: {channels}")
         for channel in channels:
-            if channel == "telegram":
-                send_telegram_notification(config, message)
-            elif channel == "email":
-                send_email_notification(config, message)
-            elif channel == "slack":
-                send_slack_notification(config, message)
-            elif channel == "sms":
-                send_sms_notification(config, message)
-            elif channel == "viber":
-                send_viber_notification(config, message)
-            elif channel == "messenger":
-                send_messenger_notification(config, message)
-            else:
+            sender = _DISPATCH.get(channel)
+            if sender is None:
                 logger.warning(f"Unknown notification channel: {channel}")
                 print(f"{YELLOW}Unknown notification channel: {channel}{RESET}")
+            else:
+                senders.append(sender)
     else:
         logger.info("No notification section found in config, trying individual channel sections")
-        # Fallback: check individual sections
-        if config.has_section("telegram") and config.getboolean("telegram", "enabled", fallback=False):
-            send_telegram_notification(config, message)
-        if config.has_section("email") and config.getboolean("email", "enabled", fallback=False):
-            send_email_notification(config, message)
-        if config.has_section("slack") and config.getboolean("slack", "enabled", fallback=False):
-            send_slack_notification(config, message)
-        if config.has_section("sms") and config.getboolean("sms", "enabled", fallback=False):
-            send_sms_notification(config, message)
-        if config.has_section("viber") and config.getboolean("viber", "enabled", fallback=False):
-            send_viber_notification(config, message)
+        # Fallback: every channel whose own section is enabled
+        for channel, sender in _DISPATCH.items():
+            if config.has_section(channel) and config.getboolean(channel, "enabled", fallback=False):
+                senders.append(sender)
+    _send_concurrently(senders, config, message)
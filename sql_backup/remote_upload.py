@@ -1,6 +1,10 @@
 import os
+import posixpath
+import queue
 import subprocess
 import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .backup import ARCHIVE_EXTENSIONS
 from .logger import get_logger
 
 # Get logger for this module
@@ -13,10 +17,44 @@ RED = "\033[0;31m"
 RESET = "\033[0m"
 TIMESTAMP = datetime.datetime.now().strftime("%F")
 
+def _load_private_key(paramiko, remote_config: dict):
+    """Load the configured SFTP private key, or return None to use password authentication."""
+    key_file = remote_config.get("key_file", "").strip()
+    if not key_file or not os.path.exists(key_file):
+        return None
+    key_passphrase = remote_config.get("key_passphrase", None)
+    return paramiko.RSAKey.from_private_key_file(key_file, password=key_passphrase)
+
+def _connect_sftp(paramiko, private_key, host: str, port: int, username: str, password: str) -> tuple:
+    """Open an authenticated SFTP session and return a (transport, sftp_client) tuple."""
+    transport = paramiko.Transport((host, port))
+    try:
+        if private_key is not None:
+            transport.connect(username=username, pkey=private_key)
+            logger.debug("Connected to SFTP using key authentication")
+        else:
+            transport.connect(username=username, password=password)
+            logger.debug("Connected to SFTP using password authentication")
+        return transport, paramiko.SFTPClient.from_transport(transport)
+    except Exception:
+        transport.close()
+        raise
+
+def _upload_one(idle_clients: queue.Queue, local_path: str, remote_path: str) -> None:
+    """Upload one file using an SFTP client borrowed from the idle pool."""
+    sftp = idle_clients.get()
+    try:
+        # putfo writes through a pipelined SFTPFile, so requests are not ACKed one by one
+        with open(local_path, "rb") as f:
+            sftp.putfo(f, remote_path, file_size=os.fstat(f.fileno()).st_size)
+    finally:
+        idle_clients.put(sftp)
+
 def upload_backups(remote_config: dict) -> None:
     """
-    Upload backup files (those containing the current TIMESTAMP) to a remote server.
-    Supports protocols: sftp, ftp, scp.
+    Upload today's backup archives (named "<db>-<TIMESTAMP>.<ext>") to a remote server.
+    Supports protocols: sftp, ftp, scp. SFTP uploads run in parallel over
+    "sftp_workers" connections (default 4).
     """
     from .config import get_config
     
@@ -24,8 +62,9 @@ def upload_backups(remote_config: dict) -> None:
     backup_dir = config.get("backup", "backup_dir")
     
     logger.info("Starting remote backup upload")
-    pattern = f"-{TIMESTAMP}."
-    files_to_upload = [f for f in os.listdir(backup_dir) if pattern in f]
+    suffixes = tuple(f"-{TIMESTAMP}.{ext}" for ext in sorted(set(ARCHIVE_EXTENSIONS.values())))
+    with os.scandir(backup_dir) as entries:
+        files_to_upload = [e.name for e in entries if e.name.endswith(suffixes) and e.is_file()]
     if not files_to_upload:
         logger.warning("No backup files found for upload")
         print(f"{YELLOW}No backup files found for upload.{RESET}")
@@ -49,35 +88,71 @@ def upload_backups(remote_config: dict) -> None:
             print(f"{RED}Paramiko not installed. SFTP upload not available.{RESET}")
             return
         try:
-            transport = paramiko.Transport((host, port))
-            key_file = remote_config.get("key_file", "").strip()
-            if key_file and os.path.exists(key_file):
-                key_passphrase = remote_config.get("key_passphrase", None)
-                private_key = paramiko.RSAKey.from_private_key_file(key_file, password=key_passphrase)
-                transport.connect(username=username, pkey=private_key)
-                logger.debug("Connected to SFTP using key authentication")
-            else:
-                transport.connect(username=username, password=password)
-                logger.debug("Connected to SFTP using password authentication")
-            sftp = paramiko.SFTPClient.from_transport(transport)
+            private_key = _load_private_key(paramiko, remote_config)
+        except Exception as e:
+            logger.error(f"SFTP upload failed: could not load private key: {e}")
+            print(f"{RED}SFTP upload failed: could not load private key: {e}{RESET}")
+            return
+        workers = max(1, min(int(remote_config.get("sftp_workers", 4)), len(files_to_upload)))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        sessions = []
+        # One transport per worker so transfers run on independent connections.
+        # The handshakes run concurrently; carry on with the sessions that
+        # connect and give up only if none do
+        connecting = [executor.submit(_connect_sftp, paramiko, private_key, host, port, username, password)
+                      for _ in range(workers)]
+        for future in as_completed(connecting):
+            try:
+                sessions.append(future.result())
+            except Exception as e:
+                logger.warning(f"Could not open SFTP session to {host}:{port}: {e}")
+        if not sessions:
+            executor.shutdown()
+            logger.error(f"SFTP upload failed: no session to {host}:{port} could be opened")
+            print(f"{RED}SFTP upload failed: could not connect to {host}:{port}{RESET}")
+            return
+        workers = len(sessions)
+        try:
+            sftp = sessions[0][1]
             try:
                 sftp.chdir(remote_directory)
             except IOError:
                 logger.info(f"Creating remote directory: {remote_directory}")
                 sftp.mkdir(remote_directory)
                 sftp.chdir(remote_directory)
+            # Only this session changed directory, so give every upload an absolute path
+            remote_directory = sftp.normalize(".")
+            idle_clients = queue.Queue()
+            for _, client in sessions:
+                idle_clients.put(client)
+            logger.debug(f"Uploading over {workers} parallel SFTP sessions")
+            failed = []
+            futures = {}
             for file in files_to_upload:
                 local_path = os.path.join(backup_dir, file)
-                remote_path = os.path.join(remote_directory, file)
+                remote_path = posixpath.join(remote_directory, file)
                 logger.info(f"Uploading {file} to {host}:{remote_path}")
                 print(f"{BLUE}Uploading {file} to {host}:{remote_path}{RESET}")
-                sftp.put(local_path, remote_path)
-            sftp.close()
-            transport.close()
-            logger.info("SFTP upload completed successfully")
+                futures[executor.submit(_upload_one, idle_clients, local_path, remote_path)] = file
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.append(futures[future])
+                    logger.error(f"SFTP upload failed for {futures[future]}: {e}")
+                    print(f"{RED}SFTP upload failed for {futures[future]}: {e}{RESET}")
+            if failed:
+                logger.warning(f"SFTP upload completed with errors for: {', '.join(failed)}")
+            else:
+                logger.info("SFTP upload completed successfully")
         except Exception as e:
             logger.error(f"SFTP upload failed: {e}")
             print(f"{RED}SFTP upload failed: {e}{RESET}")
+        finally:
+            executor.shutdown()
+            for transport, client in sessions:
+                client.close()
+                transport.close()
     elif protocol == "ftp":
         from ftplib import FTP
         try:
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Tests for the dump -> archive path of backup_database and the run_backups
+worker pool, run against a fake mysqldump
+"""
+
+import unittest
+import configparser
+import gzip
+import importlib.util
+import lzma
+import io
+import os
+import shutil
+import signal
+import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sql_backup import backup
+from sql_backup import config as config_module
+from sql_backup.config import MysqlSettings
+
+# Stands in for mysqldump: prints a dump of the database named last on the
+# command line, a partial one and a failing exit status for "broken", or
+# hangs after the first line for "slow"
+FAKE_MYSQLDUMP = """#!{python}
+import sys, time
+db = sys.argv[-1]
+out = sys.stdout.buffer
+out.write(b"-- dump of " + db.encode() + b"\\n")
+if db == "broken":
+    sys.exit(2)
+if db == "slow":
+    out.flush()
+    time.sleep(60)
+for i in range(20000):
+    out.write(b"INSERT INTO t VALUES (%d, 'row');\\n" % i)
+"""
+
+
+def _expected_dump(db: str) -> bytes:
+    rows = b"".join(b"INSERT INTO t VALUES (%d, 'row');\n" % i for i in range(20000))
+    return b"-- dump of " + db.encode() + b"\n" + rows
+
+
+class _FakeMysqldumpTestCase(unittest.TestCase):
+    """Points the backup settings at a temporary backup_dir and the fake mysqldump."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.backup_dir = os.path.join(self.test_dir, 'backups')
+        os.mkdir(self.backup_dir)
+        self.mysqldump = os.path.join(self.test_dir, 'mysqldump')
+        with open(self.mysqldump, 'w') as f:
+            f.write(FAKE_MYSQLDUMP.format(python=sys.executable))
+        os.chmod(self.mysqldump, 0o755)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    @contextmanager
+    def _configured(self, archive_format: str, **backup_options):
+        """Install a config for the fake mysqldump and yield it."""
+        config = configparser.ConfigParser()
+        config.read_dict({
+            'backup': {'backup_dir': self.backup_dir, 'archive_format': archive_format, **backup_options},
+            'mysql': {'user': 'root', 'password': '', 'host': 'localhost',
+                      'mysql_path': '/bin/false', 'mysqldump_path': self.mysqldump,
+                      'ignored_databases': 'sys, tmp_*'},
+        })
+        with patch.object(config_module, 'CONFIG', config), \
+                patch.object(config_module, 'BACKUP_SETTINGS', None), \
+                patch.object(config_module, 'MYSQL_SETTINGS', None), \
+                patch.object(config_module, 'EXPORT_SETTINGS', None), \
+                patch.object(backup, '_dump_cmd_base', None), \
+                patch.object(backup, '_ignored_db_regex', None), \
+                patch.object(backup, '_ignored_db_regex_ready', False), \
+                patch.object(backup, '_client_config_path', os.devnull):
+            yield config
+
+
+class TestBackupDatabase(_FakeMysqldumpTestCase):
+    """backup_database must produce archives that decompress to the dump."""
+
+    def _backup(self, db: str, archive_format: str) -> tuple:
+        with self._configured(archive_format):
+            return backup.backup_database(db)
+
+    def _archive_path(self, db: str, archive_format: str) -> str:
+        extension = backup.ARCHIVE_EXTENSIONS[archive_format]
+        return os.path.join(self.backup_dir, f"{db}-{backup.TIMESTAMP}.{extension}")
+
+    def _read_archive(self, path: str, archive_format: str) -> bytes:
+        if archive_format == 'none':
+            with open(path, 'rb') as f:
+                return f.read()
+        if archive_format == 'gz':
+            with gzip.open(path, 'rb') as f:
+                return f.read()
+        if archive_format == 'xz':
+            with lzma.open(path, 'rb') as f:
+                return f.read()
+        if archive_format == 'zstd':
+            import zstandard
+            with open(path, 'rb') as f:
+                return zstandard.ZstdDecompressor().stream_reader(f).read()
+        if archive_format == 'lz4':
+            import lz4.frame
+            with lz4.frame.open(path, 'rb') as f:
+                return f.read()
+        if archive_format == 'zip':
+            with zipfile.ZipFile(path) as zipf:
+                self.assertEqual(len(zipf.namelist()), 1)
+                return zipf.read(zipf.namelist()[0])
+        if archive_format == 'tar.xz':
+            with tarfile.open(path, 'r:xz') as tar:
+                members = tar.getmembers()
+                self.assertEqual(len(members), 1)
+                return tar.extractfile(members[0]).read()
+        raise AssertionError(f"No reader for {archive_format}")
+
+    def test_formats_round_trip(self):
+        optional = {'zstd': 'zstandard', 'lz4': 'lz4'}
+        for archive_format in ('none', 'gz', 'xz', 'zstd', 'lz4', 'zip', 'tar.xz'):
+            with self.subTest(archive_format=archive_format):
+                module = optional.get(archive_format)
+                if module and importlib.util.find_spec(module) is None:
+                    self.skipTest(f"{module} not installed")
+                status, dump_size, archive_size = self._backup('shop', archive_format)
+                self.assertEqual(status, 'Success')
+                path = self._archive_path('shop', archive_format)
+                self.assertEqual(self._read_archive(path, archive_format), _expected_dump('shop'))
+                self.assertEqual(dump_size, len(_expected_dump('shop')))
+                self.assertEqual(archive_size, os.path.getsize(path))
+                # Only the archive is left behind, no staged .sql file
+                self.assertEqual(os.listdir(self.backup_dir), [os.path.basename(path)])
+                os.remove(path)
+
+    def test_failed_dump_removes_archive(self):
+        for archive_format in ('none', 'gz', 'zip', 'tar.xz'):
+            with self.subTest(archive_format=archive_format):
+                self.assertEqual(self._backup('broken', archive_format), ('Error', 0, 0))
+                self.assertEqual(os.listdir(self.backup_dir), [])
+
+    def test_unknown_format_falls_back_to_none(self):
+        status, _, _ = self._backup('shop', 'bogus')
+        self.assertEqual(status, 'Success')
+        self.assertEqual(self._read_archive(self._archive_path('shop', 'none'), 'none'),
+                         _expected_dump('shop'))
+
+
+class FakeProgressBar:
+    """Stands in for tqdm and records output written while the bar is on screen."""
+
+    def __init__(self):
+        self.shown = True
+        self.writing = False
+        self.overwritten = []
+
+    @contextmanager
+    def external_write_mode(self):
+        self.writing = True
+        try:
+            yield
+        finally:
+            self.writing = False
+
+    def update(self, n: int = 1):
+        pass
+
+    def close(self):
+        self.shown = False
+
+
+class _BarCheckingOutput(io.StringIO):
+    """stdout that notes text written over a shown progress bar."""
+
+    def __init__(self, bar: FakeProgressBar):
+        super().__init__()
+        self.bar = bar
+
+    def write(self, text: str) -> int:
+        if text.strip() and self.bar.shown and not self.bar.writing:
+            self.bar.overwritten.append(text)
+        return super().write(text)
+
+
+class TestRunBackups(_FakeMysqldumpTestCase):
+    """run_backups collects results from the worker pool and stops cleanly on Ctrl-C."""
+
+    def _run(self, databases: list, parallel: int, out: io.StringIO = None,
+             archive_format: str = 'gz') -> tuple:
+        out = out if out is not None else io.StringIO()
+        with self._configured(archive_format, parallel=str(parallel)) as config, \
+                patch.object(backup, 'check_mysql_connection'), \
+                patch.object(backup, 'close_mysql_connection'), \
+                patch.object(backup, 'get_all_databases', return_value=databases), \
+                redirect_stdout(out):
+            errors, summary = backup.run_backups(config)
+        return errors, summary, out.getvalue()
+
+    def test_collects_every_result(self):
+        with redirect_stderr(io.StringIO()) as err:
+            errors, summary, output = self._run(['shop', 'broken', 'sys', 'blog', 'tmp_x'], parallel=2)
+        self.assertEqual(errors, ['broken'])
+        self.assertEqual(sorted(line.split(':')[0] for line in summary.splitlines()),
+                         ['blog', 'broken', 'shop'])
+        self.assertIn("Backing up 3 databases (2 skipped) with 2 parallel workers", output)
+        for db in ('shop', 'broken', 'sys', 'blog', 'tmp_x'):
+            self.assertIn(f"| {db:25} |", output)
+        # Without a terminal each finished database gets one progress line on stderr,
+        # so the table on stdout is left unbroken
+        self.assertNotIn("[1/3]", output)
+        progress_lines = err.getvalue().splitlines()
+        self.assertEqual([line.split(']')[0] for line in progress_lines], ['[1/3', '[2/3', '[3/3'])
+        self.assertIn("broken … Error", err.getvalue())
+        self.assertEqual(sorted(os.listdir(self.backup_dir)),
+                         [f"blog-{backup.TIMESTAMP}.sql.gz", f"shop-{backup.TIMESTAMP}.sql.gz"])
+
+    def test_worker_errors_are_written_around_progress_bar(self):
+        bar = FakeProgressBar()
+        out = _BarCheckingOutput(bar)
+        # The bar only appears once the header and skipped rows are printed
+        bar.shown = False
+        def create_bar(total):
+            bar.shown = True
+            return bar
+        with patch.object(backup, '_create_progress_bar', side_effect=create_bar):
+            errors, _, output = self._run(['broken', 'shop'], parallel=2, out=out)
+        self.assertEqual(errors, ['broken'])
+        self.assertIn("Error dumping broken", output)
+        self.assertEqual(bar.overwritten, [])
+        self.assertFalse(bar.shown)
+        self.assertIsNone(backup._progress_bar)
+
+    def test_progress_bar_is_closed_when_a_worker_fails(self):
+        bar = FakeProgressBar()
+        with patch.object(backup, '_create_progress_bar', return_value=bar), \
+                patch.object(backup, '_timed_backup', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                self._run(['shop'], parallel=1)
+        self.assertFalse(bar.shown)
+        self.assertIsNone(backup._progress_bar)
+
+    @unittest.skipUnless(hasattr(signal, 'SIGINT') and os.name == 'posix', "needs POSIX signals")
+    def test_interrupt_stops_dumps_and_restores_handler(self):
+        previous_handler = signal.getsignal(signal.SIGINT)
+        # tar.xz stages the dump in a .sql file and compresses it afterwards
+        for archive_format in ('gz', 'tar.xz'):
+            with self.subTest(archive_format=archive_format):
+                timer = threading.Timer(1.0, os.kill, (os.getpid(), signal.SIGINT))
+                timer.start()
+                start = time.monotonic()
+                try:
+                    with self.assertRaises(KeyboardInterrupt):
+                        self._run(['slow', 'shop', 'blog'], parallel=1, archive_format=archive_format)
+                finally:
+                    timer.cancel()
+                # The hanging dump was killed instead of waited for
+                self.assertLess(time.monotonic() - start, 30)
+                self.assertEqual(backup._active_dumps, set())
+                # Queued databases never started; partial archives and staged dumps were removed
+                self.assertEqual(os.listdir(self.backup_dir), [])
+                self.assertIs(signal.getsignal(signal.SIGINT), previous_handler)
+                self.assertFalse(backup._stop_requested.is_set())
+
+    def test_no_dump_or_compression_starts_after_interrupt(self):
+        finish_dump = backup._finish_dump
+
+        def finish_then_interrupt(proc):
+            # Ctrl-C arrives after mysqldump exits, before tar.xz compression starts
+            returncode = finish_dump(proc)
+            backup._stop_requested.set()
+            return returncode
+
+        try:
+            with self._configured('tar.xz'):
+                with patch.object(backup, '_finish_dump', side_effect=finish_then_interrupt), \
+                        patch.object(backup, '_archive_tarxz') as archive_tarxz:
+                    self.assertEqual(backup.backup_database('shop'), ('Error', 0, 0))
+                archive_tarxz.assert_not_called()
+                with patch.object(backup.subprocess, 'Popen') as popen:
+                    self.assertEqual(backup.backup_database('blog'), ('Error', 0, 0))
+                popen.assert_not_called()
+        finally:
+            backup._stop_requested.clear()
+        self.assertEqual(os.listdir(self.backup_dir), [])
+
+    def test_interrupt_stops_tarxz_compression(self):
+        sql_file = os.path.join(self.test_dir, 'shop.sql')
+        with open(sql_file, 'wb') as f:
+            f.write(_expected_dump('shop'))
+        archive_file = os.path.join(self.backup_dir, 'shop.sql.tar.xz')
+        settings = config_module.BackupSettings(self.backup_dir, 'tar.xz', 1, 6, 3, 0)
+        backup._stop_requested.set()
+        try:
+            with self.assertRaises(backup._BackupInterrupted):
+                backup._archive_tarxz(sql_file, archive_file, settings)
+        finally:
+            backup._stop_requested.clear()
+
+
+class TestIgnoredDatabases(unittest.TestCase):
+    """ignored_databases wildcards are compiled into one regex."""
+
+    def test_no_patterns(self):
+        self.assertIsNone(backup._compile_ignored_patterns([]))
+        self.assertIsNone(backup._compile_ignored_patterns(['']))
+
+    def test_patterns_match_like_fnmatch(self):
+        regex = backup._compile_ignored_patterns(['sys', 'proj_*', 'tmp?'])
+        for name in ('sys', 'proj_a', 'proj_', 'tmp1'):
+            with self.subTest(name=name):
+                self.assertIsNotNone(regex.match(name))
+        for name in ('mysys', 'sys2', 'proj', 'tmp12'):
+            with self.subTest(name=name):
+                self.assertIsNone(regex.match(name))
+
+    def test_is_ignored_uses_config(self):
+        settings = MysqlSettings(
+            user='root', password='', host='localhost', mysql_path='', mysqldump_path='',
+            ignored_databases=('information_schema', 'test_*'))
+        with patch.object(config_module, 'MYSQL_SETTINGS', settings), \
+                patch.object(backup, '_ignored_db_regex', None), \
+                patch.object(backup, '_ignored_db_regex_ready', False):
+            self.assertTrue(backup.is_ignored('information_schema'))
+            self.assertTrue(backup.is_ignored('test_shop'))
+            self.assertFalse(backup.is_ignored('shop'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for validating the [backup] section options that only fail at archive time
+"""
+
+import unittest
+import configparser
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sql_backup.config_validator import ConfigValidator
+
+
+class TestBackupSectionValidation(unittest.TestCase):
+    """Out-of-range [backup] options are rejected by the validator."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _errors(self, **options) -> list:
+        config = configparser.ConfigParser()
+        config.read_dict({'backup': {'backup_dir': self.test_dir, 'archive_format': 'gz', **options}})
+        validator = ConfigValidator()
+        validator._validate_backup_section(config)
+        return validator.errors
+
+    def test_defaults_are_valid(self):
+        self.assertEqual(self._errors(), [])
+
+    def test_gz_level(self):
+        self.assertEqual(self._errors(gz_level='0'), [])
+        self.assertEqual(self._errors(gz_level='9'), [])
+        self.assertEqual(self._errors(gz_level='12'), ["gz_level must be between 0 and 9"])
+        self.assertEqual(self._errors(gz_level='-1'), ["gz_level must be between 0 and 9"])
+
+    def test_zstd_level(self):
+        self.assertEqual(self._errors(zstd_level='1'), [])
+        self.assertEqual(self._errors(zstd_level='22'), [])
+        self.assertEqual(self._errors(zstd_level='0'), ["zstd_level must be between 1 and 22"])
+        self.assertEqual(self._errors(zstd_level='23'), ["zstd_level must be between 1 and 22"])
+
+    def test_xz_preset(self):
+        self.assertEqual(self._errors(xz_preset='9'), [])
+        self.assertEqual(self._errors(xz_preset='42'), ["xz_preset must be between 0 and 9"])
+
+    def test_parallel(self):
+        self.assertEqual(self._errors(parallel='1'), [])
+        self.assertEqual(self._errors(parallel='0'), ["parallel must be at least 1"])
+
+    def test_non_integers_are_left_to_type_checks(self):
+        self.assertEqual(self._errors(gz_level='high', parallel='many'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for the mysql.connector metadata connection and its fallback to the mysql client
+"""
+
+import unittest
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import types
+from contextlib import redirect_stdout
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sql_backup import backup
+from sql_backup import config as config_module
+from sql_backup.config import MysqlSettings
+
+
+class FakeMySQLError(Exception):
+    """Stands in for mysql.connector.Error."""
+
+
+class TestMySQLConnection(unittest.TestCase):
+    """Metadata queries use mysql.connector when it works and the mysql client otherwise."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.extra_file = self._option_file('extra.cnf')
+        settings = MysqlSettings(user='root', password='', host='localhost',
+                                 mysql_path='/usr/bin/mysql', mysqldump_path='/usr/bin/mysqldump',
+                                 ignored_databases=())
+        self.connector = types.ModuleType('mysql.connector')
+        self.connector.Error = FakeMySQLError
+        self.connector.connect = MagicMock()
+        self.optionfiles = types.ModuleType('mysql.connector.optionfiles')
+        self.optionfiles.read_option_files = MagicMock(return_value={'host': '127.0.0.1', 'user': 'root'})
+        self.connector.optionfiles = self.optionfiles
+        mysql = types.ModuleType('mysql')
+        mysql.connector = self.connector
+        self.patchers = [
+            patch.object(config_module, 'MYSQL_SETTINGS', settings),
+            patch.object(backup, '_client_config_path', self.extra_file),
+            patch.object(backup, '_MYSQL_GLOBAL_OPTION_FILES', ()),
+            patch.object(backup, '_MYSQL_USER_OPTION_FILE', os.path.join(self.test_dir, 'missing.cnf')),
+            patch.object(backup, '_MYSQL_LOGIN_PATH_FILE', os.path.join(self.test_dir, 'missing.mylogin.cnf')),
+            patch.dict(os.environ),
+            patch.object(backup, '_mysql_connection', None),
+            patch.object(backup, '_mysql_connection_attempted', False),
+            patch.dict(sys.modules, {'mysql': mysql, 'mysql.connector': self.connector,
+                                     'mysql.connector.optionfiles': self.optionfiles}),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        os.environ.pop('MYSQL_HOME', None)
+        os.environ.pop('MYSQL_TEST_LOGIN_FILE', None)
+
+    def tearDown(self):
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+        shutil.rmtree(self.test_dir)
+
+    def _option_file(self, name: str) -> str:
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w') as f:
+            f.write("[client]\n")
+        return path
+
+    def _mysql_client(self, stdout: str = "Database\nshop\nblog\n"):
+        return patch.object(backup.subprocess, 'run', return_value=subprocess.CompletedProcess([], 0, stdout, ""))
+
+    def test_option_files_follow_the_mysql_client_order(self):
+        global_file = self._option_file('my.cnf')
+        user_file = self._option_file('user.cnf')
+        with patch.object(backup, '_MYSQL_GLOBAL_OPTION_FILES', (os.path.join(self.test_dir, 'absent.cnf'), global_file)), \
+                patch.object(backup, '_MYSQL_USER_OPTION_FILE', user_file):
+            backup.get_mysql_connection()
+        self.optionfiles.read_option_files.assert_called_once_with(
+            option_files=[global_file, self.extra_file, user_file],
+            option_groups=["client", "mysql"])
+        self.connector.connect.assert_called_once_with(host='127.0.0.1', user='root')
+
+    def test_localhost_without_socket_uses_mysql_client(self):
+        # The mysql client would use its default Unix socket, the connector TCP
+        for options in ({'host': 'localhost', 'user': 'root'}, {'user': 'root'}):
+            with self.subTest(options=options):
+                backup.close_mysql_connection()
+                self.optionfiles.read_option_files.return_value = options
+                with self._mysql_client() as mock_run:
+                    self.assertEqual(backup.get_all_databases(), ["shop", "blog"])
+                mock_run.assert_called_once()
+        self.connector.connect.assert_not_called()
+
+    def _assert_uses_mysql_client(self):
+        with self._mysql_client() as mock_run:
+            self.assertEqual(backup.get_all_databases(), ["shop", "blog"])
+        mock_run.assert_called_once()
+        self.connector.connect.assert_not_called()
+
+    def test_login_path_file_uses_mysql_client(self):
+        # A login-path host would apply to mysqldump but not to the connector
+        login_file = self._option_file('.mylogin.cnf')
+        with patch.object(backup, '_MYSQL_LOGIN_PATH_FILE', login_file):
+            self._assert_uses_mysql_client()
+        backup.close_mysql_connection()
+        with patch.dict(os.environ, {'MYSQL_TEST_LOGIN_FILE': login_file}):
+            self._assert_uses_mysql_client()
+
+    def test_mysql_home_option_file_uses_mysql_client(self):
+        os.environ['MYSQL_HOME'] = self.test_dir
+        # Without a my.cnf in $MYSQL_HOME the connector sees every file the client reads
+        self.assertIsNotNone(backup.get_mysql_connection())
+        backup.close_mysql_connection()
+        self.connector.connect.reset_mock()
+        self._option_file('my.cnf')
+        self._assert_uses_mysql_client()
+
+    def test_localhost_with_socket_uses_the_connector(self):
+        options = {'host': 'localhost', 'unix_socket': '/run/mysqld/mysqld.sock', 'user': 'root'}
+        self.optionfiles.read_option_files.return_value = options
+        self.assertIsNotNone(backup.get_mysql_connection())
+        self.connector.connect.assert_called_once_with(**options)
+
+    def test_connection_is_opened_once(self):
+        conn = backup.get_mysql_connection()
+        self.assertIs(backup.get_mysql_connection(), conn)
+        self.connector.connect.assert_called_once()
+
+    def test_lists_databases_through_the_connector(self):
+        cursor = MagicMock()
+        cursor.__iter__.return_value = iter([("shop",), ("blog",)])
+        self.connector.connect.return_value.cursor.return_value = cursor
+        with self._mysql_client() as mock_run:
+            self.assertEqual(backup.get_all_databases(), ["shop", "blog"])
+        mock_run.assert_not_called()
+        cursor.close.assert_called_once()
+
+    def test_missing_driver_falls_back_to_mysql_client(self):
+        with patch.dict(sys.modules, {'mysql.connector': None}), self._mysql_client() as mock_run:
+            self.assertEqual(backup.get_all_databases(), ["shop", "blog"])
+        self.assertIsNone(backup._mysql_connection)
+        self.assertEqual(mock_run.call_args[0][0][:2],
+                         ['/usr/bin/mysql', f"--defaults-extra-file={self.extra_file}"])
+
+    def test_connect_error_falls_back_to_mysql_client(self):
+        self.connector.connect.side_effect = FakeMySQLError("Access denied")
+        with self._mysql_client() as mock_run:
+            self.assertEqual(backup.get_all_databases(), ["shop", "blog"])
+        mock_run.assert_called_once()
+
+    def test_unexpected_connect_error_falls_back_to_mysql_client(self):
+        # e.g. an option file value the connector cannot parse
+        self.optionfiles.read_option_files.side_effect = AttributeError("'int' object has no attribute 'split'")
+        with self._mysql_client() as mock_run:
+            self.assertEqual(backup.get_all_databases(), ["shop", "blog"])
+        mock_run.assert_called_once()
+        self.assertIsNone(backup._mysql_connection)
+
+    def test_ping_failure_falls_back_to_mysql_client(self):
+        self.connector.connect.return_value.ping.side_effect = FakeMySQLError("Lost connection")
+        with self._mysql_client("1\n1\n") as mock_run, redirect_stdout(io.StringIO()) as out:
+            backup.check_mysql_connection()
+        self.assertEqual(mock_run.call_args[0][0][-2:], ["-e", "SELECT 1;"])
+        self.assertIn("MySQL connection successful", out.getvalue())
+
+    def test_query_failure_falls_back_to_mysql_client(self):
+        self.connector.connect.return_value.cursor.return_value.execute.side_effect = FakeMySQLError("Gone away")
+        with self._mysql_client() as mock_run:
+            self.assertEqual(backup.get_all_databases(), ["shop", "blog"])
+        mock_run.assert_called_once()
+
+    def test_close_resets_cached_state(self):
+        conn = backup.get_mysql_connection()
+        backup.close_mysql_connection()
+        conn.close.assert_called_once()
+        self.assertIsNone(backup._mysql_connection)
+        self.assertFalse(backup._mysql_connection_attempted)
+        # The next call connects afresh
+        backup.get_mysql_connection()
+        self.assertEqual(self.connector.connect.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,20 @@
+import io
+import sys
+import types
 import unittest
 import configparser
+from contextlib import redirect_stdout
 from unittest.mock import patch, MagicMock
-from sql_backup.notifications import send_telegram_notification, send_email_notification, send_slack_notification
+from sql_backup import notifications
+from sql_backup.config_validator import ConfigValidator
+from sql_backup.notifications import send_telegram_notification, send_email_notification, send_slack_notification, send_sms_notification, notify_all, HTTP_TIMEOUT
 
 class TestNotifications(unittest.TestCase):
     def setUp(self):
         """Set up test configuration."""
         self.dummy_config = configparser.ConfigParser()
     
-    @patch("sql_backup.notifications.requests.post")
+    @patch("sql_backup.notifications._SESSION.post")
     def test_send_telegram_notification(self, mock_post):
         # Prepare a dummy config with telegram enabled
         self.dummy_config.add_section("telegram")
@@ -17,7 +23,7 @@ class TestNotifications(unittest.TestCase):
         self.dummy_config.set("telegram", "telegram_chatid", "dummy_chat")
         
         send_telegram_notification(self.dummy_config, "Test Telegram message")
-        self.assertTrue(mock_post.called, "requests.post was not called for Telegram")
+        self.assertTrue(mock_post.called, "_SESSION.post was not called for Telegram")
 
     @patch("sql_backup.notifications.smtplib.SMTP")
     def test_send_email_notification(self, mock_smtp):
@@ -33,7 +39,7 @@ class TestNotifications(unittest.TestCase):
         send_email_notification(self.dummy_config, "Test Email message")
         self.assertTrue(mock_smtp.called, "SMTP was not called for Email")
 
-    @patch("sql_backup.notifications.requests.post")
+    @patch("sql_backup.notifications._SESSION.post")
     def test_send_slack_notification(self, mock_post):
         # Configure the mock to simulate a successful Slack response
         mock_response = MagicMock()
@@ -48,14 +54,118 @@ class TestNotifications(unittest.TestCase):
         # Call the Slack notification function
         send_slack_notification(self.dummy_config, "Test Slack message")
 
-        # Ensure requests.post was actually called
-        self.assertTrue(mock_post.called, "requests.post was not called for Slack")
+        # Ensure the shared session was actually used
+        self.assertTrue(mock_post.called, "_SESSION.post was not called for Slack")
 
-        # Verify we call requests.post with the correct URL and JSON payload
+        # Verify we post to the correct URL with the JSON payload and a timeout
         mock_post.assert_called_once_with(
             "https://hooks.slack.com/services/dummy",
-            json={"text": "Test Slack message"}
+            json={"text": "Test Slack message"},
+            timeout=HTTP_TIMEOUT
         )
 
+class TestSMSNotification(unittest.TestCase):
+    def setUp(self):
+        """Set up an enabled [sms] section and a stand-in twilio.rest.Client."""
+        self.dummy_config = configparser.ConfigParser()
+        self.dummy_config.read_dict({"sms": {
+            "enabled": "true",
+            "account_sid": "AC123",
+            "auth_token": "token",
+            "from_number": "+15550000000",
+            "to_numbers": "+15551111111, +15552222222",
+        }})
+        self.client = MagicMock()
+        twilio_rest = types.ModuleType("twilio.rest")
+        twilio_rest.Client = MagicMock(return_value=self.client)
+        self.modules_patcher = patch.dict(sys.modules, {"twilio": types.ModuleType("twilio"), "twilio.rest": twilio_rest})
+        self.modules_patcher.start()
+
+    def tearDown(self):
+        self.modules_patcher.stop()
+
+    def _send(self) -> str:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            send_sms_notification(self.dummy_config, "Test SMS message")
+        return out.getvalue()
+
+    def _recipients(self) -> list:
+        return sorted(call[1]["to"] for call in self.client.messages.create.call_args_list)
+
+    def test_sends_from_number(self):
+        self.assertIn("SMS notification sent.", self._send())
+        self.assertEqual(self._recipients(), ["+15551111111", "+15552222222"])
+        for call in self.client.messages.create.call_args_list:
+            self.assertEqual(call[1]["from_"], "+15550000000")
+            self.assertNotIn("messaging_service_sid", call[1])
+
+    def test_messaging_service_sid_replaces_from_number(self):
+        self.dummy_config.set("sms", "messaging_service_sid", "MG123")
+        self.dummy_config.remove_option("sms", "from_number")
+        self._send()
+        self.assertEqual(self._recipients(), ["+15551111111", "+15552222222"])
+        for call in self.client.messages.create.call_args_list:
+            self.assertEqual(call[1]["messaging_service_sid"], "MG123")
+            self.assertNotIn("from_", call[1])
+
+    def test_failed_recipient_is_reported(self):
+        def create(body, to, **sender):
+            if to == "+15551111111":
+                raise RuntimeError("unreachable")
+        self.client.messages.create.side_effect = create
+        output = self._send()
+        self.assertIn("SMS notification failed for: +15551111111", output)
+        # The other recipient is still sent to
+        self.assertEqual(self._recipients(), ["+15551111111", "+15552222222"])
+
+    def test_separators_only_are_reported(self):
+        self.dummy_config.set("sms", "to_numbers", " , ")
+        self.assertIn("SMS notification skipped: no recipients in to_numbers", self._send())
+        self.client.messages.create.assert_not_called()
+
+    def test_validator_needs_from_number_only_without_service(self):
+        validator = ConfigValidator()
+        self.dummy_config.remove_option("sms", "from_number")
+        validator._validate_sms_config(self.dummy_config)
+        self.assertEqual(validator.errors, ["SMS field 'from_number' is required when SMS notifications are enabled"])
+
+        validator = ConfigValidator()
+        self.dummy_config.set("sms", "messaging_service_sid", "MG123")
+        validator._validate_sms_config(self.dummy_config)
+        self.assertEqual(validator.errors, [])
+
+
+class TestNotifyAll(unittest.TestCase):
+    def setUp(self):
+        """Replace every channel sender with a mock."""
+        self.senders = {channel: MagicMock() for channel in notifications._DISPATCH}
+        self.dispatch_patcher = patch.dict(notifications._DISPATCH, self.senders)
+        self.dispatch_patcher.start()
+        self.dummy_config = configparser.ConfigParser()
+
+    def tearDown(self):
+        self.dispatch_patcher.stop()
+
+    def _called(self) -> list:
+        return sorted(channel for channel, sender in self.senders.items() if sender.called)
+
+    def test_dispatches_configured_channels(self):
+        self.dummy_config.read_dict({"notification": {"channels": "Slack, messenger, bogus"}})
+        with redirect_stdout(io.StringIO()) as out:
+            notify_all(self.dummy_config, "Backup done")
+        self.assertEqual(self._called(), ["messenger", "slack"])
+        self.senders["slack"].assert_called_once_with(self.dummy_config, "Backup done")
+        self.assertIn("Unknown notification channel: bogus", out.getvalue())
+
+    def test_fallback_uses_enabled_sections(self):
+        self.dummy_config.read_dict({
+            "telegram": {"enabled": "true"},
+            "email": {"enabled": "false"},
+            "messenger": {"enabled": "true"},
+        })
+        notify_all(self.dummy_config, "Backup done")
+        self.assertEqual(self._called(), ["messenger", "telegram"])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel SFTP upload pool of remote_upload.upload_backups, run against a fake paramiko
+"""
+
+import unittest
+import configparser
+import io
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+from contextlib import redirect_stdout
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sql_backup import config as config_module
+from sql_backup import remote_upload
+
+
+class FakeSFTPClient:
+    """Records uploads and fails if two threads ever use it at once."""
+
+    def __init__(self, home: str = "/home/backup", failing_files: tuple = ()):
+        self.cwd = home
+        self.existing = {home}
+        self.failing_files = failing_files
+        self.uploads = []
+        self.overlapped = False
+        self.closed = False
+        self._busy = threading.Lock()
+
+    def chdir(self, path: str):
+        path = path if path.startswith("/") else f"{self.cwd}/{path}"
+        if path not in self.existing:
+            raise IOError(f"No such file: {path}")
+        self.cwd = path
+
+    def mkdir(self, path: str):
+        self.existing.add(path if path.startswith("/") else f"{self.cwd}/{path}")
+
+    def normalize(self, path: str) -> str:
+        return self.cwd
+
+    def putfo(self, f, remote_path: str, file_size: int = 0):
+        if not self._busy.acquire(blocking=False):
+            self.overlapped = True
+            return
+        try:
+            time.sleep(0.01)
+            if os.path.basename(remote_path).startswith(self.failing_files):
+                raise IOError("Permission denied")
+            self.uploads.append((remote_path, f.read(), file_size))
+        finally:
+            self._busy.release()
+
+    def close(self):
+        self.closed = True
+
+
+class TestSFTPUpload(unittest.TestCase):
+    """upload_backups spreads files over the SFTP sessions that connect."""
+
+    def setUp(self):
+        self.backup_dir = tempfile.mkdtemp()
+        self.files = [f"{db}-{remote_upload.TIMESTAMP}.sql.gz" for db in ("a", "b", "c", "d")]
+        for name in self.files:
+            with open(os.path.join(self.backup_dir, name), "wb") as f:
+                f.write(name.encode())
+        config = configparser.ConfigParser()
+        config.read_dict({"backup": {"backup_dir": self.backup_dir}})
+        self.config_patcher = patch.object(config_module, "CONFIG", config)
+        self.config_patcher.start()
+        self.transports = []
+        self.clients = []
+
+    def tearDown(self):
+        self.config_patcher.stop()
+        shutil.rmtree(self.backup_dir)
+
+    def _upload(self, failing_connections: tuple = (), failing_files: tuple = (), connect=None,
+                key_error: Exception = None, **remote) -> str:
+        """Run upload_backups with a fake paramiko; the Nth connect fails if N is in failing_connections."""
+        lock = threading.Lock()
+
+        def make_transport(address):
+            transport = MagicMock()
+            with lock:
+                if len(self.transports) in failing_connections:
+                    transport.connect.side_effect = OSError("Connection refused")
+                elif connect is not None:
+                    transport.connect.side_effect = connect
+                self.transports.append(transport)
+            return transport
+
+        def make_client(transport):
+            client = FakeSFTPClient(failing_files=failing_files)
+            with lock:
+                self.clients.append(client)
+            return client
+
+        paramiko = types.ModuleType("paramiko")
+        paramiko.Transport = make_transport
+        paramiko.SFTPClient = types.SimpleNamespace(from_transport=make_client)
+        paramiko.RSAKey = self.rsa_key = MagicMock()
+        self.rsa_key.from_private_key_file.side_effect = key_error
+        remote_config = {"protocol": "sftp", "host": "backup.example.com", "username": "backup",
+                         "password": "secret", "remote_directory": "dumps", **remote}
+        out = io.StringIO()
+        with patch.dict(sys.modules, {"paramiko": paramiko}), redirect_stdout(out):
+            remote_upload.upload_backups(remote_config)
+        return out.getvalue()
+
+    def _uploaded(self) -> dict:
+        return {path: data for client in self.clients for path, data, _ in client.uploads}
+
+    def test_uploads_over_every_session(self):
+        self._upload(sftp_workers="2")
+        self.assertEqual(len(self.clients), 2)
+        self.assertEqual(self._uploaded(),
+                         {f"/home/backup/dumps/{name}": name.encode() for name in self.files})
+        for client in self.clients:
+            self.assertFalse(client.overlapped)
+            self.assertTrue(client.closed)
+        for transport in self.transports:
+            transport.close.assert_called_once()
+
+    def test_only_todays_archives_are_uploaded(self):
+        # Same date but not an archive, an archive from another day, and a directory
+        with open(os.path.join(self.backup_dir, f"backup-{remote_upload.TIMESTAMP}.log"), "wb") as f:
+            f.write(b"log")
+        with open(os.path.join(self.backup_dir, "a-2000-01-01.sql.gz"), "wb") as f:
+            f.write(b"old")
+        os.mkdir(os.path.join(self.backup_dir, f"old-{remote_upload.TIMESTAMP}.sql.gz"))
+        output = self._upload(sftp_workers="2")
+        self.assertEqual(sorted(os.path.basename(path) for path in self._uploaded()), self.files)
+        self.assertEqual(output.count("Uploading "), len(self.files))
+        self.assertNotIn("failed", output)
+
+    def test_missing_remote_directory_is_created(self):
+        self._upload(sftp_workers="1")
+        self.assertEqual(self.clients[0].cwd, "/home/backup/dumps")
+
+    def test_sessions_use_the_absolute_remote_directory(self):
+        # Only one session changes directory; the others still start in the home directory
+        self._upload(sftp_workers="3")
+        self.assertEqual(sorted(client.cwd for client in self.clients),
+                         ["/home/backup", "/home/backup", "/home/backup/dumps"])
+        for client in self.clients:
+            for path, _, _ in client.uploads:
+                self.assertTrue(path.startswith("/home/backup/dumps/"))
+
+    def test_sessions_connect_concurrently(self):
+        # Each handshake waits for the other one, so connecting one after another would time out
+        barrier = threading.Barrier(2, timeout=5)
+        self._upload(connect=lambda **kwargs: barrier.wait(), sftp_workers="2")
+        self.assertEqual(len(self.clients), 2)
+        self.assertEqual(len(self._uploaded()), len(self.files))
+
+    def test_private_key_is_loaded_once(self):
+        key_file = os.path.join(self.backup_dir, "id_rsa")
+        open(key_file, "w").close()
+        self._upload(sftp_workers="3", key_file=key_file, key_passphrase="phrase")
+        self.rsa_key.from_private_key_file.assert_called_once_with(key_file, password="phrase")
+        private_key = self.rsa_key.from_private_key_file.return_value
+        for transport in self.transports:
+            transport.connect.assert_called_once_with(username="backup", pkey=private_key)
+        self.assertEqual(len(self._uploaded()), len(self.files))
+
+    def test_unreadable_private_key_uploads_nothing(self):
+        key_file = os.path.join(self.backup_dir, "id_rsa")
+        open(key_file, "w").close()
+        output = self._upload(key_error=ValueError("bad passphrase"), sftp_workers="2", key_file=key_file)
+        self.assertEqual(self.transports, [])
+        self.assertIn("SFTP upload failed: could not load private key: bad passphrase", output)
+
+    def test_failed_connections_are_skipped(self):
+        output = self._upload(failing_connections=(0, 2), sftp_workers="3")
+        self.assertEqual(len(self.clients), 1)
+        self.assertEqual(len(self._uploaded()), len(self.files))
+        self.transports[0].close.assert_called_once()
+        self.transports[2].close.assert_called_once()
+        self.assertNotIn("SFTP upload failed", output)
+
+    def test_no_connection_uploads_nothing(self):
+        output = self._upload(failing_connections=(0, 1), sftp_workers="2")
+        self.assertEqual(self.clients, [])
+        self.assertIn("SFTP upload failed: could not connect to backup.example.com:22", output)
+
+    def test_failed_file_is_reported_and_others_continue(self):
+        output = self._upload(failing_files=("b-",), sftp_workers="2")
+        self.assertIn(f"SFTP upload failed for {self.files[1]}: Permission denied", output)
+        self.assertEqual(sorted(os.path.basename(path) for path in self._uploaded()),
+                         [name for name in self.files if not name.startswith("b-")])
+
+
+if __name__ == '__main__':
+    unittest.main()
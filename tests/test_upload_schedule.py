@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the upload schedule check of backup.should_upload, run against a fixed date
+"""
+
+import unittest
+import datetime
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sql_backup import backup
+
+
+class TestShouldUpload(unittest.TestCase):
+    """should_upload compares the schedule against the date the run started."""
+
+    def setUp(self):
+        # Results are cached per schedule, so each test starts from an empty cache
+        backup.should_upload.cache_clear()
+        self.addCleanup(backup.should_upload.cache_clear)
+
+    def _on(self, year: int, month: int, day: int, last_day: int):
+        today = datetime.date(year, month, day)
+        backup.should_upload.cache_clear()
+        patchers = [
+            patch.object(backup, '_TODAY', today),
+            patch.object(backup, '_TODAY_WEEKDAY', today.strftime("%A").lower()),
+            patch.object(backup, '_LAST_DAY_OF_MONTH', last_day),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_daily(self):
+        self._on(2024, 2, 14, 29)
+        self.assertTrue(backup.should_upload("daily"))
+        self.assertTrue(backup.should_upload(" Daily "))
+
+    def test_first_day(self):
+        self._on(2024, 2, 1, 29)
+        self.assertTrue(backup.should_upload("first_day"))
+        self._on(2024, 2, 2, 29)
+        self.assertFalse(backup.should_upload("first_day"))
+
+    def test_last_day(self):
+        self._on(2024, 2, 29, 29)
+        self.assertTrue(backup.should_upload("last_day"))
+        self._on(2024, 2, 28, 29)
+        self.assertFalse(backup.should_upload("last_day"))
+
+    def test_weekday(self):
+        # 2024-02-14 is a Wednesday
+        self._on(2024, 2, 14, 29)
+        self.assertTrue(backup.should_upload("wednesday"))
+        self.assertTrue(backup.should_upload("Wednesday"))
+        self.assertFalse(backup.should_upload("thursday"))
+
+    def test_numeric_day(self):
+        self._on(2024, 2, 14, 29)
+        self.assertTrue(backup.should_upload("14"))
+        self.assertFalse(backup.should_upload("15"))
+        self.assertFalse(backup.should_upload("31"))
+
+    def test_invalid_value(self):
+        self._on(2024, 2, 14, 29)
+        self.assertFalse(backup.should_upload("weekly"))
+        self.assertFalse(backup.should_upload("fortnightly"))
+        self.assertFalse(backup.should_upload(""))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for the validate_config command-line tool
+"""
+
+import unittest
+import configparser
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import validate_config
+
+
+class TestValidation(unittest.TestCase):
+    """The validator reads values the way sqlBackup does."""
+
+    def test_interpolation_errors_are_reported(self):
+        from sql_backup.config_validator import get_validation_report
+        config = configparser.ConfigParser()
+        config.read_string("[mysql]\npassword = se%cret\nuser = %(missing)s\n")
+        report = get_validation_report(config)
+        self.assertFalse(report.is_valid)
+        self.assertEqual(report.error_count, 2)
+        self.assertIn("'password' in section [mysql]", report.errors[0])
+
+
+class TestLoadConfigFile(unittest.TestCase):
+    """load_config_file reports unreadable paths instead of raising."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.test_dir, 'config.ini')
+        with open(self.config_file, 'w') as f:
+            f.write("[backup]\nbackup_dir = /tmp\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_loads_file(self):
+        with redirect_stdout(io.StringIO()):
+            config = validate_config.load_config_file(self.config_file)
+        self.assertEqual(config.options('backup'), ['backup_dir'])
+
+    def test_path_through_a_file_is_not_found(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            config = validate_config.load_config_file(os.path.join(self.config_file, 'x'))
+        self.assertIsNone(config)
+        self.assertIn("Configuration file not found", out.getvalue())
+
+
+class TestParseArgs(unittest.TestCase):
+    """The hand-rolled argument parser accepts what argparse used to."""
+
+    def test_defaults(self):
+        args = validate_config._parse_args([])
+        self.assertEqual(args.config_file, 'config.ini')
+        self.assertFalse(any([args.verbose, args.sections, args.quiet,
+                              args.check_dependencies]))
+
+    def test_flags_and_config_file(self):
+        args = validate_config._parse_args(['-vs', 'my.ini', '--check-dep'])
+        self.assertEqual(args.config_file, 'my.ini')
+        self.assertTrue(args.verbose and args.sections and args.check_dependencies)
+        self.assertFalse(args.quiet)
+
+    def test_double_dash_ends_options(self):
+        args = validate_config._parse_args(['-q', '--', '-odd-name.ini'])
+        self.assertTrue(args.quiet)
+        self.assertEqual(args.config_file, '-odd-name.ini')
+
+    def test_help(self):
+        for argv in (['-h'], ['config.ini', '--help'], ['-vh'], ['--he']):
+            with self.subTest(argv=argv):
+                self.assertIsNone(validate_config._parse_args(argv))
+
+    def test_usage_errors(self):
+        for argv in (['-x'], ['--bogus'], ['a.ini', 'b.ini'], ['-vx']):
+            with self.subTest(argv=argv):
+                with self.assertRaises(validate_config._UsageError):
+                    validate_config._parse_args(argv)
+
+    @patch.object(sys, 'argv', ['validate_config.py', '--bogus'])
+    def test_main_reports_usage_error(self):
+        err = io.StringIO()
+        with patch.object(sys, 'stderr', err):
+            self.assertEqual(validate_config.main(), 2)
+        self.assertIn("unrecognized arguments: --bogus", err.getvalue())
+
+    @patch.object(sys, 'argv', ['validate_config.py', '--help'])
+    def test_main_prints_help(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(validate_config.main(), 0)
+        self.assertTrue(out.getvalue().startswith("usage: validate_config.py [-h]"))
+        self.assertIn("Examples:", out.getvalue())
+
+
+    def test_dependency_check_is_written_at_once(self):
+        config_file = os.path.join(os.path.dirname(__file__), '..', 'config.ini.default')
+        writes = []
+        out = io.StringIO()
+        with patch.object(sys, 'argv', ['validate_config.py', config_file, '--check-dependencies']), \
+                patch.object(validate_config, 'print_validation_results'), \
+                redirect_stdout(out), \
+                patch.object(out, 'write', side_effect=writes.append):
+            validate_config.main()
+        block = next(text for text in writes if "DEPENDENCY CHECK" in text)
+        self.assertIn(validate_config._HLINE, block)
+        for dep in ('requests', 'paramiko', 'twilio'):
+            self.assertIn(f" {dep:10} - ", block)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Help and usage errors are answered without loading the package or configparser."""
+
+    def _modules_after(self, returncode: int, *argv):
+        """Run main() in a fresh interpreter and return the names of the modules it loaded."""
+        root = os.path.join(os.path.dirname(__file__), '..')
+        code = (
+            "import sys, validate_config\n"
+            "sys.argv = ['validate_config.py'] + sys.argv[1:]\n"
+            "status = validate_config.main()\n"
+            "sys.stdout.write('\\n' + ' '.join(sys.modules))\n"
+            "sys.exit(status)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code, *argv], cwd=root,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                universal_newlines=True)
+        # A child that crashed prints no module list, which would pass every assertNotIn
+        self.assertEqual(result.returncode, returncode, result.stderr)
+        modules = set(result.stdout.rsplit('\n', 1)[-1].split())
+        self.assertIn('validate_config', modules)
+        return modules
+
+    def test_help(self):
+        modules = self._modules_after(0, '--help')
+        self.assertNotIn('sql_backup', modules)
+        self.assertNotIn('sql_backup.config_validator', modules)
+        self.assertNotIn('configparser', modules)
+
+    def test_usage_error(self):
+        modules = self._modules_after(2, '--bogus')
+        self.assertNotIn('sql_backup', modules)
+        self.assertNotIn('configparser', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
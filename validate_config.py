@@ -6,173 +6,254 @@ Validates configuration files and provides detailed reports.
 
 import os
 import sys
-import argparse
-import configparser
-from typing import Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+if TYPE_CHECKING:
+    import configparser
+    from sql_backup.config_validator import ValidationReport
 
-from sql_backup.config_validator import get_validation_report, ConfigurationError
+# Command-line flags and the argument attribute each one sets
+_FLAGS = {
+    '-h': 'help', '--help': 'help',
+    '-v': 'verbose', '--verbose': 'verbose',
+    '-s': 'sections', '--sections': 'sections',
+    '-q': 'quiet', '--quiet': 'quiet',
+    '--check-dependencies': 'check_dependencies',
+}
+_LONG_OPTIONS = tuple(flag for flag in _FLAGS if flag.startswith('--'))
 
+# Help text in argparse's layout; {prog} is the script name and {pad} lines
+# the wrapped usage up under it
+_USAGE = """\
+usage: {prog} [-h] [-v] [-s] [-q] [--check-dependencies]
+       {pad}[config_file]
+"""
+
+_OPTIONS_HELP = _USAGE + """
+Validate sqlBackup configuration files
+
+positional arguments:
+  config_file           Configuration file to validate (default: config.ini)
+
+options:
+  -h, --help            show this help message and exit
+  -v, --verbose         Show detailed validation information
+  -s, --sections        Show configuration sections summary
+  -q, --quiet           Only show overall validation status (overrides
+                        --sections and --check-dependencies)
+  --check-dependencies  Check if optional dependencies are installed
+"""
+
+# Examples shown after the options in --help
+_EPILOG = """\
+Examples:
+  {prog} config.ini                    # Validate config.ini
+  {prog} config.ini --verbose          # Detailed validation report
+  {prog} config.ini --sections         # Show section summary
+  {prog} config.ini --quiet            # Only show overall status
+
+--quiet ignores --sections and --check-dependencies, so scripts and CI
+pipelines only get the overall status.
+"""
 
-def load_config_file(config_path: str) -> Optional[configparser.ConfigParser]:
+_STATIC_HELP = _OPTIONS_HELP + "\n" + _EPILOG
+
+_HLINE = "-" * 40
+_DHLINE = "=" * 60
+# Numbered error/warning line; %-formatting an (index, text) tuple
+_ITEM_FMT = "%2d. %s"
+
+# Fixed pieces of the validation report
+_REPORT_HEADER = ("", _DHLINE, "📋 CONFIGURATION VALIDATION REPORT", _DHLINE)
+_STATUS_VALID = "🎉 Overall Status: ✅ VALID"
+_STATUS_INVALID = "💥 Overall Status: ❌ INVALID"
+_SUMMARY_FMT = "📊 Summary: %d errors, %d warnings"
+_HDR_ERRORS = "\n🚨 ERRORS ("
+_HDR_WARNINGS = "\n⚠️  WARNINGS ("
+_ADVICE_INVALID = (
+    "\n💡 RECOMMENDATIONS",
+    _HLINE,
+    "1. Fix all errors listed above before running sqlBackup",
+    "2. Review warnings - they may indicate potential issues",
+    "3. Use config.ini.default as a reference for correct configuration",
+    "4. Test configuration changes with this validator",
+)
+_ADVICE_WARNINGS = (
+    "\n💡 RECOMMENDATIONS",
+    _HLINE,
+    "1. Review warnings - they may indicate potential issues",
+    "2. Consider addressing warnings for optimal performance",
+)
+_ADVICE_PERFECT = (
+    "\n🎯 PERFECT CONFIGURATION!",
+    _HLINE,
+    "✅ No errors or warnings found",
+    "✅ Configuration is ready for production use",
+)
+
+
+def load_config_file(config_path: str) -> Optional["configparser.ConfigParser"]:
     """Load configuration file and return ConfigParser object."""
-    if not os.path.exists(config_path):
+    try:
+        os.stat(config_path)
+    except OSError:
         print(f"❌ Configuration file not found: {config_path}")
         return None
     
+    import configparser
     config = configparser.ConfigParser()
     try:
-        config.read(config_path)
+        # Default encoding, same as sqlBackup itself uses when it reads the config
+        with open(config_path) as f:
+            config.read_file(f, config_path)
         print(f"✅ Configuration file loaded: {config_path}")
-        return config
+    except OSError as e:
+        print(f"❌ Error reading configuration file: {e}")
+        return None
     except configparser.Error as e:
         print(f"❌ Error parsing configuration file: {e}")
         return None
+    return config
 
 
-def print_validation_results(report: dict, verbose: bool = False):
+def print_validation_results(report: "ValidationReport", verbose: bool = False):
     """Print validation results in a formatted way."""
-    print("\n" + "=" * 60)
-    print("📋 CONFIGURATION VALIDATION REPORT")
-    print("=" * 60)
+    is_valid = report.is_valid
+    errors = report.errors
+    warnings = report.warnings
+    out = list(_REPORT_HEADER)
     
     # Overall status
-    if report['is_valid']:
-        print("🎉 Overall Status: ✅ VALID")
-    else:
-        print("💥 Overall Status: ❌ INVALID")
-    
-    print(f"📊 Summary: {report['error_count']} errors, {report['warning_count']} warnings")
+    out.append(_STATUS_VALID if is_valid else _STATUS_INVALID)
+    out.append(_SUMMARY_FMT % (report.error_count, report.warning_count))
     
     # Errors section
-    if report['errors']:
-        print(f"\n🚨 ERRORS ({len(report['errors'])})")
-        print("-" * 40)
-        for i, error in enumerate(report['errors'], 1):
-            print(f"{i:2}. {error}")
+    if errors:
+        out += [_HDR_ERRORS + str(len(errors)) + ")", _HLINE]
+        out.append("\n".join(_ITEM_FMT % item for item in enumerate(errors, 1)))
     
     # Warnings section
-    if report['warnings']:
-        print(f"\n⚠️  WARNINGS ({len(report['warnings'])})")
-        print("-" * 40)
-        for i, warning in enumerate(report['warnings'], 1):
-            print(f"{i:2}. {warning}")
+    if warnings:
+        out += [_HDR_WARNINGS + str(len(warnings)) + ")", _HLINE]
+        out.append("\n".join(_ITEM_FMT % item for item in enumerate(warnings, 1)))
     
     # Recommendations
-    if not report['is_valid']:
-        print(f"\n💡 RECOMMENDATIONS")
-        print("-" * 40)
-        print("1. Fix all errors listed above before running sqlBackup")
-        print("2. Review warnings - they may indicate potential issues")
-        print("3. Use config.ini.default as a reference for correct configuration")
-        print("4. Test configuration changes with this validator")
-    
-    if report['warnings'] and report['is_valid']:
-        print(f"\n💡 RECOMMENDATIONS")
-        print("-" * 40)
-        print("1. Review warnings - they may indicate potential issues")
-        print("2. Consider addressing warnings for optimal performance")
-    
-    if report['is_valid'] and not report['warnings']:
-        print(f"\n🎯 PERFECT CONFIGURATION!")
-        print("-" * 40)
-        print("✅ No errors or warnings found")
-        print("✅ Configuration is ready for production use")
-
-
-def print_section_summary(config: configparser.ConfigParser):
+    if not is_valid:
+        out += _ADVICE_INVALID
+    elif warnings:
+        out += _ADVICE_WARNINGS
+    else:
+        out += _ADVICE_PERFECT
+    
+    out.append("")
+    sys.stdout.write("\n".join(out))
+
+
+_SECTION_DESCRIPTIONS = {
+    'backup': 'Backup settings and archive format',
+    'mysql': 'MySQL connection and tools configuration',
+    'logging': 'Logging level and output settings',
+    'telegram': 'Telegram notification settings',
+    'email': 'Email notification settings',
+    'slack': 'Slack notification settings',
+    'sms': 'SMS notification settings (Twilio)',
+    'viber': 'Viber notification settings',
+    'messenger': 'Messenger notification settings',
+    'notification': 'Notification channel configuration',
+    'remote': 'Remote upload settings',
+    'export': 'Database export options'
+}
+_ESSENTIAL = frozenset(['backup', 'mysql'])
+_RECOMMENDED = frozenset(['logging'])
+
+
+def print_section_summary(config: "configparser.ConfigParser"):
     """Print a summary of configuration sections."""
-    print(f"\n📁 CONFIGURATION SECTIONS")
-    print("-" * 40)
-    
-    section_descriptions = {
-        'backup': 'Backup settings and archive format',
-        'mysql': 'MySQL connection and tools configuration',
-        'logging': 'Logging level and output settings',
-        'telegram': 'Telegram notification settings',
-        'email': 'Email notification settings',
-        'slack': 'Slack notification settings',
-        'sms': 'SMS notification settings (Twilio)',
-        'viber': 'Viber notification settings',
-        'messenger': 'Messenger notification settings',
-        'notification': 'Notification channel configuration',
-        'remote': 'Remote upload settings',
-        'export': 'Database export options'
-    }
-    
-    for section_name in config.sections():
-        description = section_descriptions.get(section_name, 'Custom section')
+    out = ["\n📁 CONFIGURATION SECTIONS", _HLINE]
+    
+    sections = config.sections()
+    for section_name in sections:
+        description = _SECTION_DESCRIPTIONS.get(section_name, 'Custom section')
         option_count = len(config.options(section_name))
-        print(f"  [{section_name:12}] {description} ({option_count} options)")
+        out.append(f"  [{section_name:12}] {description} ({option_count} options)")
     
     # Check for missing common sections
-    missing_sections = []
-    essential_sections = ['backup', 'mysql']
-    recommended_sections = ['logging']
-    
-    for section in essential_sections:
-        if not config.has_section(section):
-            missing_sections.append(f"❌ [{section}] - Required")
-    
-    for section in recommended_sections:
-        if not config.has_section(section):
-            missing_sections.append(f"⚠️  [{section}] - Recommended")
+    present = set(sections)
+    missing_sections = [f"❌ [{section}] - Required" for section in sorted(_ESSENTIAL - present)]
+    missing_sections += [f"⚠️  [{section}] - Recommended" for section in sorted(_RECOMMENDED - present)]
     
     if missing_sections:
-        print(f"\n📋 MISSING SECTIONS")
-        print("-" * 40)
-        for missing in missing_sections:
-            print(f"  {missing}")
+        out += ["\n📋 MISSING SECTIONS", _HLINE]
+        out.extend(f"  {missing}" for missing in missing_sections)
+    
+    out.append("")
+    sys.stdout.write("\n".join(out))
+
+
+class _UsageError(Exception):
+    """Invalid command-line arguments."""
+
+
+def _parse_args(argv: list) -> Optional[SimpleNamespace]:
+    """
+    Parse command-line arguments the way argparse would for this CLI:
+    combined short flags (-vs), unambiguous long-option prefixes and "--".
+    Returns None if help was requested; raises _UsageError on bad input.
+    """
+    args = SimpleNamespace(config_file='config.ini', verbose=False, sections=False,
+                           quiet=False, check_dependencies=False)
+    positional = []
+    unrecognized = []
+    options_done = False
+    for arg in argv:
+        if options_done or arg == '-' or not arg.startswith('-'):
+            positional.append(arg)
+            continue
+        if arg == '--':
+            options_done = True
+            continue
+        if arg.startswith('--'):
+            names = [arg] if arg in _LONG_OPTIONS else [opt for opt in _LONG_OPTIONS if opt.startswith(arg)]
+            if len(names) > 1:
+                raise _UsageError(f"ambiguous option: {arg} could match {', '.join(names)}")
+        else:
+            names = ['-' + flag for flag in arg[1:]]
+            if not all(name in _FLAGS for name in names):
+                names = []
+        if not names:
+            unrecognized.append(arg)
+            continue
+        for name in names:
+            if _FLAGS[name] == 'help':
+                return None
+            setattr(args, _FLAGS[name], True)
+    if positional:
+        args.config_file = positional[0]
+    unrecognized += positional[1:]
+    if unrecognized:
+        raise _UsageError(f"unrecognized arguments: {' '.join(unrecognized)}")
+    return args
+
+
+def _get_report(config: "configparser.ConfigParser") -> "ValidationReport":
+    """Validate config; the validator is only imported once there is a config to check."""
+    from sql_backup.config_validator import get_validation_report
+    return get_validation_report(config)
 
 
 def main():
     """Main CLI function."""
-    parser = argparse.ArgumentParser(
-        description="Validate sqlBackup configuration files",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s config.ini                    # Validate config.ini
-  %(prog)s config.ini --verbose          # Detailed validation report
-  %(prog)s config.ini --sections         # Show section summary
-  %(prog)s config.ini --quiet            # Only show overall status
-        """
-    )
-    
-    parser.add_argument(
-        'config_file',
-        nargs='?',
-        default='config.ini',
-        help='Configuration file to validate (default: config.ini)'
-    )
-    
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Show detailed validation information'
-    )
-    
-    parser.add_argument(
-        '-s', '--sections',
-        action='store_true',
-        help='Show configuration sections summary'
-    )
-    
-    parser.add_argument(
-        '-q', '--quiet',
-        action='store_true',
-        help='Only show overall validation status'
-    )
-    
-    parser.add_argument(
-        '--check-dependencies',
-        action='store_true',
-        help='Check if optional dependencies are installed'
-    )
-    
-    args = parser.parse_args()
+    prog = os.path.basename(sys.argv[0])
+    pad = ' ' * (len(prog) + 1)
+    try:
+        args = _parse_args(sys.argv[1:])
+    except _UsageError as e:
+        sys.stderr.write(_USAGE.format(prog=prog, pad=pad) + f"{prog}: error: {e}\n")
+        return 2
+    if args is None:
+        sys.stdout.write(_STATIC_HELP.format(prog=prog, pad=pad))
+        return 0
     
     # Load configuration file
     config = load_config_file(args.config_file)
@@ -180,13 +261,12 @@ Examples:
         return 1
     
     # Show sections summary if requested
-    if args.sections:
+    if args.sections and not args.quiet:
         print_section_summary(config)
     
     # Check dependencies if requested
-    if args.check_dependencies:
-        print(f"\n🔍 DEPENDENCY CHECK")
-        print("-" * 40)
+    if args.check_dependencies and not args.quiet:
+        out = ["\n🔍 DEPENDENCY CHECK", _HLINE]
         
         dependencies = {
             'requests': 'HTTP notifications (Telegram, Slack, Viber)',
@@ -194,29 +274,33 @@ Examples:
             'twilio': 'SMS notifications'
         }
         
+        # find_spec only locates the module, it doesn't run its (often heavy) import
+        import importlib.util
         for dep, description in dependencies.items():
-            try:
-                __import__(dep)
-                print(f"✅ {dep:10} - {description}")
-            except ImportError:
-                print(f"❌ {dep:10} - {description} (install with: pip install {dep})")
+            if importlib.util.find_spec(dep) is not None:
+                out.append(f"✅ {dep:10} - {description}")
+            else:
+                out.append(f"❌ {dep:10} - {description} (install with: pip install {dep})")
+        out.append("")
+        sys.stdout.write("\n".join(out))
     
     # Perform validation
-    report = get_validation_report(config)
+    report = _get_report(config)
+    is_valid = report.is_valid
     
     # Print results based on verbosity
     if args.quiet:
-        if report['is_valid']:
+        if is_valid:
             print("✅ Configuration is valid")
             return 0
         else:
-            print(f"❌ Configuration is invalid ({report['error_count']} errors)")
+            print(f"❌ Configuration is invalid ({report.error_count} errors)")
             return 1
     else:
         print_validation_results(report, args.verbose)
     
     # Return appropriate exit code
-    return 0 if report['is_valid'] else 1
+    return 0 if is_valid else 1
 
 
 if __name__ == "__main__":